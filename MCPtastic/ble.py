@@ -1,6 +1,9 @@
 # Messaging and communication tools
+import asyncio
 import meshtastic
-from meshtastic.ble_interface import BLEInterface
+
+# BLEInterface.scan() has a fixed 10 second discovery window, bound the whole call a little above it
+BLE_SCAN_TIMEOUT = 15.0
 
 def register_ble(mcp, interface_manager: meshtastic.mesh_interface.MeshInterface):
     """Register Bluetooth low energy functionality"""
@@ -9,20 +12,30 @@ def register_ble(mcp, interface_manager: meshtastic.mesh_interface.MeshInterface
     async def ble_scan() -> str:
         """run a ble scan for devices
         """
-        out = "starting BLE scan...\n"
-        for x in BLEInterface.scan():
-            out += f"Found: name='{x.name}' address='{x.address}'\n"
-        return out
+        # Deferred so bleak is only imported when a scan is requested
+        from meshtastic.ble_interface import BLEInterface
+        lines = ["starting BLE scan..."]
+        try:
+            devices = await asyncio.wait_for(asyncio.to_thread(BLEInterface.scan), timeout=BLE_SCAN_TIMEOUT)
+        except asyncio.TimeoutError:
+            lines.append(f"BLE scan timed out after {BLE_SCAN_TIMEOUT:g} seconds")
+            devices = []
+        for x in devices:
+            lines.append(f"Found: name='{x.name}' address='{x.address}'")
+        return "\n".join(lines) + "\n"
     
     @mcp.tool()
-    async def ble_connect(address: str) -> str:
+    async def ble_connect(address: str, timeout: int = 30) -> str:
         """connect to a BLE device
+        
+        Args:
+            timeout (int): Seconds to wait for the radio before failing. Defaults to 30.
         """
         out = "connecting to BLE device...\n"
         try:
             # Use the shared interface management module for consistent caching and connection handling
-            iface = interface_manager.set_interface(address, "ble")
-            iface.connect()
+            iface = await asyncio.to_thread(interface_manager.set_interface, address, "ble", timeout=timeout)
+            await asyncio.to_thread(iface.connect)
             out += f"Connected to {address}\n"
         except Exception as e:
             out += f"Failed to connect: {e}\n"
@@ -1,18 +1,37 @@
 # Device information and configuration tools
+import asyncio
+import atexit
 import contextlib
-import io
 import json
+import logging
 import meshtastic
 from meshtastic import mt_config
 import meshtastic.tcp_interface
-import re
+import queue
 import sqlite3
-from typing import Dict, Any, List, Optional, Union
+import threading
+from concurrent.futures import Future
+from typing import Dict, Any, List, Optional, Tuple, Union
 from google.protobuf.json_format import MessageToDict
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 
 import yaml
 
+from utils import json_dumps, json_loads
+
+# The server talks JSON-RPC over stdout, so the save path logs instead of printing
+logger = logging.getLogger(__name__)
+
+def _find_section(content: str, label: str, to_end: bool = False) -> Optional[str]:
+    """Return the text after a showInfo() label, up to the end of its line or of the content."""
+    start = content.find(label)
+    if start == -1:
+        return None
+    start += len(label)
+    end = -1 if to_end else content.find("\n", start)
+    return content[start:] if end == -1 else content[start:end]
+
 def parse_meshtastic_output(content: str) -> Dict[str, Union[Optional[str], Dict[str, Any]]]:
     """
     Parse a Meshtastic output content string into four separate components:
@@ -26,14 +45,13 @@ def parse_meshtastic_output(content: str) -> Dict[str, Union[Optional[str], Dict
     """
     try:
         # Extract Owner information (simple text, not JSON)
-        owner_match = re.search(r'Owner: (.+)', content)
-        owner: Optional[str] = owner_match.group(1) if owner_match else None
+        owner: Optional[str] = _find_section(content, "Owner: ") or None
         
-        # Extract MyInfo JSON object
-        my_info_match = re.search(r'My info: (\{.+?\})', content)
-        if my_info_match:
+        # Extract MyInfo JSON object, printed on a single line
+        my_info_text = _find_section(content, "My info: ")
+        if my_info_text:
             try:
-                my_info: Dict[str, Any] = json.loads(my_info_match.group(1))
+                my_info: Dict[str, Any] = json_loads(my_info_text)
             except json.JSONDecodeError:
                 print("Error parsing MyInfo JSON")
                 my_info = {}
@@ -41,10 +59,10 @@ def parse_meshtastic_output(content: str) -> Dict[str, Union[Optional[str], Dict
             my_info = {}
         
         # Extract Metadata JSON object
-        metadata_match = re.search(r'Metadata: (\{.+?\})', content)
-        if metadata_match:
+        metadata_text = _find_section(content, "Metadata: ")
+        if metadata_text:
             try:
-                metadata: Dict[str, Any] = json.loads(metadata_match.group(1))
+                metadata: Dict[str, Any] = json_loads(metadata_text)
             except json.JSONDecodeError:
                 print("Error parsing Metadata JSON")
                 metadata = {}
@@ -52,11 +70,10 @@ def parse_meshtastic_output(content: str) -> Dict[str, Union[Optional[str], Dict
             metadata = {}
         
         # Extract Nodes JSON object - this is the most complex part
-        nodes_match = re.search(r'Nodes in mesh: (\{[\s\S]+)', content)
-        if nodes_match:
-            nodes_text = nodes_match.group(1)
+        nodes_text = _find_section(content, "Nodes in mesh: ", to_end=True)
+        if nodes_text:
             try:
-                nodes: Dict[str, Any] = json.loads(nodes_text)
+                nodes: Dict[str, Any] = json_loads(nodes_text)
             except json.JSONDecodeError as e:
                 print(f"Error parsing Nodes JSON: {e}")
                 nodes = {}
@@ -74,16 +91,101 @@ def parse_meshtastic_output(content: str) -> Dict[str, Union[Optional[str], Dict
         print(f"Error processing content: {str(e)}")
         return {"Owner": None, "MyInfo": {}, "Metadata": {}, "Nodes": {}}
 
-def save_json_objects(data: Dict[str, Any], db_path: str = "meshtastic.db") -> None:
+# Background writer state for queue_json_objects
+_db_queue: "queue.Queue[Tuple[Dict[str, Any], str, Future]]" = queue.Queue()
+_db_thread: Optional[threading.Thread] = None
+_db_thread_lock = threading.Lock()
+_db_connections: Dict[str, sqlite3.Connection] = {}
+
+class _ChunkWriter:
+    """Stand-in for stdout that keeps every write and joins them once at the end."""
+
+    def __init__(self):
+        self.chunks: List[str] = []
+        self.write = self.chunks.append
+
+    def flush(self) -> None:
+        pass
+
+    def getvalue(self) -> str:
+        return "".join(self.chunks)
+
+# Keys showInfo() strips from every node before printing it
+_RAW_NODE_KEYS = ("raw", "decoded", "payload")
+
+def _strip_raw_keys(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of a node dict without the raw packet keys, at any depth."""
+    return {
+        key: _strip_raw_keys(value) if isinstance(value, dict) else value
+        for key, value in node.items()
+        if key not in _RAW_NODE_KEYS
+    }
+
+def collect_device_info(iface) -> Dict[str, Union[Optional[str], Dict[str, Any]]]:
     """
-    Save each component to a SQLite database
+    Build the Owner, MyInfo, Metadata and Nodes components straight from an
+    interface, without printing showInfo() and parsing the text back
+    
+    Args:
+        iface: Connected Meshtastic interface
+        
+    Returns:
+        Dictionary with the same four keys as parse_meshtastic_output
+    """
+    nodes: Dict[str, Any] = {}
+    for node in (iface.nodes or {}).values():
+        node = _strip_raw_keys(node)
+        user = node.get("user", {})
+        if "macaddr" in user:
+            user["macaddr"] = meshtastic.util.convert_mac_addr(user["macaddr"])
+        # Key by node id, as showInfo does
+        nodes[user["id"]] = node
+    
+    return {
+        "Owner": f"{iface.getLongName()} ({iface.getShortName()})",
+        "MyInfo": _message_to_dict(iface.myInfo) if iface.myInfo else {},
+        "Metadata": _message_to_dict(iface.metadata) if iface.metadata else {},
+        "Nodes": nodes
+    }
+
+def _message_to_dict(message) -> Dict[str, Any]:
+    """
+    Convert a protobuf message the way showInfo's message_to_json does: every
+    field, including zero and default values, with camelCase keys
+    
+    Args:
+        message: Protobuf message
+        
+    Returns:
+        Dictionary of the message fields
+    """
+    try:
+        return MessageToDict(message, always_print_fields_with_no_presence=True, preserving_proto_field_name=False)
+    except TypeError:
+        # protobuf < 5.26 names the option including_default_value_fields
+        return MessageToDict(message, including_default_value_fields=True, preserving_proto_field_name=False)
+
+def _open_db(db_path: str) -> sqlite3.Connection:
+    """
+    Open the SQLite database and make sure the tables exist
     
     Args:
-        data: Dictionary with extracted Meshtastic data
         db_path: Path to the SQLite database file
+        
+    Returns:
+        Open connection to the database
     """
-    conn = sqlite3.connect(db_path)
+    # The writer thread owns the connection, check_same_thread is off so shutdown can close it
+    # isolation_level=None leaves transactions to us: each write is one explicit BEGIN/COMMIT
+    conn = sqlite3.connect(db_path, cached_statements=256, check_same_thread=False, isolation_level=None)
+    # WAL with synchronous=NORMAL only fsyncs the log on commit instead of the whole database
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-8000")
     cursor = conn.cursor()
+    cursor.execute("BEGIN IMMEDIATE")
     
     # Create tables if they don't exist
     cursor.execute('''
@@ -103,119 +205,189 @@ def save_json_objects(data: Dict[str, Any], db_path: str = "meshtastic.db") -> N
     )
     ''')
     
+    # Upgrade nodes tables written before the scalar columns were generated from node_data
+    # or before the table dropped its rowid
+    existing = cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'nodes'").fetchone()
+    legacy_nodes = existing is not None and "WITHOUT ROWID" not in existing[0].upper()
+    if legacy_nodes:
+        cursor.execute("ALTER TABLE nodes RENAME TO nodes_legacy")
+    
+    # Only node_data is stored, every other column is read out of it by sqlite on demand
     cursor.execute('''
     CREATE TABLE IF NOT EXISTS nodes (
         id TEXT PRIMARY KEY,
-        long_name TEXT,
-        short_name TEXT,
-        hw_model TEXT,
-        public_key TEXT,
-        role TEXT,
-        position_lat REAL,
-        position_lon REAL,
-        position_alt INTEGER,
-        battery_level INTEGER,
-        channel_utilization REAL,
-        air_util_tx REAL,
-        snr REAL,
-        hops_away INTEGER,
-        channel INTEGER,
-        last_heard TIMESTAMP,
-        since TIMESTAMP,   
-        node_data JSON,
+        node_data JSON NOT NULL,
+        long_name TEXT GENERATED ALWAYS AS (json_extract(node_data, '$.user.longName')) VIRTUAL,
+        short_name TEXT GENERATED ALWAYS AS (json_extract(node_data, '$.user.shortName')) VIRTUAL,
+        hw_model TEXT GENERATED ALWAYS AS (json_extract(node_data, '$.user.hwModel')) VIRTUAL,
+        public_key TEXT GENERATED ALWAYS AS (json_extract(node_data, '$.user.publicKey')) VIRTUAL,
+        role TEXT GENERATED ALWAYS AS (json_extract(node_data, '$.user.role')) VIRTUAL,
+        position_lat REAL GENERATED ALWAYS AS (json_extract(node_data, '$.position.latitude')) VIRTUAL,
+        position_lon REAL GENERATED ALWAYS AS (json_extract(node_data, '$.position.longitude')) VIRTUAL,
+        position_alt INTEGER GENERATED ALWAYS AS (json_extract(node_data, '$.position.altitude')) VIRTUAL,
+        battery_level INTEGER GENERATED ALWAYS AS (json_extract(node_data, '$.deviceMetrics.batteryLevel')) VIRTUAL,
+        channel_utilization REAL GENERATED ALWAYS AS (json_extract(node_data, '$.deviceMetrics.channelUtilization')) VIRTUAL,
+        air_util_tx REAL GENERATED ALWAYS AS (json_extract(node_data, '$.deviceMetrics.airUtilTx')) VIRTUAL,
+        snr REAL GENERATED ALWAYS AS (json_extract(node_data, '$.snr')) VIRTUAL,
+        hops_away INTEGER GENERATED ALWAYS AS (json_extract(node_data, '$.hopsAway')) VIRTUAL,
+        channel INTEGER GENERATED ALWAYS AS (json_extract(node_data, '$.channel')) VIRTUAL,
+        last_heard TIMESTAMP GENERATED ALWAYS AS (
+            strftime('%Y-%m-%dT%H:%M:%S', json_extract(node_data, '$.lastHeard'), 'unixepoch')
+        ) VIRTUAL,
+        since TIMESTAMP GENERATED ALWAYS AS (
+            strftime('%Y-%m-%dT%H:%M:%S',
+                     json_extract(node_data, '$.lastHeard') - json_extract(node_data, '$.deviceMetrics.uptimeSeconds'),
+                     'unixepoch')
+        ) VIRTUAL,
         created TIMESTAMP,
         last_updated DATETIME DEFAULT CURRENT_TIMESTAMP
-    )
+    ) WITHOUT ROWID
     ''')
     
-    # Insert owner information
-    if data.get("Owner"):
+    if legacy_nodes:
         cursor.execute('''
-        INSERT OR REPLACE INTO owner (id, name, timestamp)
-        VALUES (1, ?, CURRENT_TIMESTAMP)
-        ''', (data["Owner"],))
-        print(f"Saved Owner data to database")
+        INSERT INTO nodes (id, node_data, created, last_updated)
+        SELECT id, node_data, created, last_updated FROM nodes_legacy WHERE node_data IS NOT NULL
+        ''')
+        cursor.execute("DROP TABLE nodes_legacy")
+    
+    cursor.execute("COMMIT")
+    return conn
+
+def save_json_objects(data: Dict[str, Any], db_path: str = "meshtastic.db") -> Tuple[bool, int, int]:
+    """
+    Save each component to a SQLite database
+    
+    Args:
+        data: Dictionary with extracted Meshtastic data
+        db_path: Path to the SQLite database file
+        
+    Returns:
+        Whether the owner was written, the number of device info rows and the number of nodes
+    """
+    conn = _open_db(db_path)
+    try:
+        return _write_json_objects(conn, data)
+    finally:
+        conn.close()
+
+def _write_json_objects(conn: sqlite3.Connection, data: Dict[str, Any]) -> Tuple[bool, int, int]:
+    """
+    Write each component over an open connection and commit
     
-    # Insert MyInfo and Metadata
-    for info_type in ["MyInfo", "Metadata"]:
-        if data.get(info_type):
+    Args:
+        conn: Connection returned by _open_db
+        data: Dictionary with extracted Meshtastic data
+        
+    Returns:
+        Whether the owner was written, the number of device info rows and the number of nodes
+    """
+    cursor = conn.cursor()
+    # Take the write lock up front so the whole snapshot lands in one transaction
+    cursor.execute("BEGIN IMMEDIATE")
+    try:
+        # Insert owner information
+        if data.get("Owner"):
+            cursor.execute('''
+            INSERT OR REPLACE INTO owner (id, name, timestamp)
+            VALUES (1, ?, CURRENT_TIMESTAMP)
+            ''', (data["Owner"],))
+        
+        # Insert MyInfo and Metadata
+        info_types = [info_type for info_type in ("MyInfo", "Metadata") if data.get(info_type)]
+        for info_type in info_types:
             cursor.execute('''
             INSERT OR REPLACE INTO device_info (info_type, data, timestamp)
             VALUES (?, ?, CURRENT_TIMESTAMP)
-            ''', (info_type, json.dumps(data[info_type])))
-            print(f"Saved {info_type} data to database")
-    
-    # Insert or update nodes
-    if data.get("Nodes"):
-        for node_id, node_data in data["Nodes"].items():
-            # Extract user fields
-            user_data = node_data.get("user", {})
-            long_name = user_data.get("longName")
-            short_name = user_data.get("shortName")
-            hw_model = user_data.get("hwModel")
-            public_key = user_data.get("publicKey")
-            role = user_data.get("role")
-            
-            # Extract position data
-            position_data = node_data.get("position", {})
-            position_lat = position_data.get("latitude")
-            position_lon = position_data.get("longitude")
-            position_alt = position_data.get("altitude")
-            
-            # Extract metrics
-            metrics = node_data.get("deviceMetrics", {})
-            battery_level = metrics.get("batteryLevel")
-            channel_util = metrics.get("channelUtilization")
-            air_util_tx = metrics.get("airUtilTx")
-            uptime_seconds = metrics.get("uptimeSeconds")
-            
-            # Other top-level fields
-            snr = node_data.get("snr")
-            hops_away = node_data.get("hopsAway")
-            channel = node_data.get("channel")
-            last_heard = node_data.get("lastHeard")
-            
-            # Convert timestamps
-            last_heard_ts = None
-            since_ts = None
-            
-            if last_heard is not None:
-                # Convert Unix timestamp to ISO8601 format
-                last_heard_ts = datetime.fromtimestamp(last_heard).isoformat()
-            
-            # Calculate "since" field - last_heard minus uptime_seconds gives the start time
-            if last_heard is not None and uptime_seconds is not None:
-                since_unix = last_heard - uptime_seconds
-                since_ts = datetime.fromtimestamp(since_unix).isoformat()
-            
-            # Check if record already exists to preserve created timestamp
-            cursor.execute("SELECT created FROM nodes WHERE id = ?", (node_id,))
-            existing = cursor.fetchone()
-            
-            # If record exists, use its created timestamp, otherwise use current time
-            current_time = datetime.now().isoformat()
-            created_timestamp = existing[0] if existing else current_time
+            ''', (info_type, json_dumps(data[info_type], indent=False)))
+        
+        # Insert or update nodes
+        if data.get("Nodes"):
+            # One UTC timestamp for the whole batch, matching the UTC last_heard/since columns
+            now = datetime.now(timezone.utc).replace(tzinfo=None).isoformat(timespec="seconds")
+            rows = [(node_id, json_dumps(node_data, indent=False), now) for node_id, node_data in data["Nodes"].items()]
             
-            cursor.execute('''
-            INSERT OR REPLACE INTO nodes (
-                id, long_name, short_name, hw_model, public_key, role, 
-                position_lat, position_lon, position_alt,
-                battery_level, channel_utilization, air_util_tx, 
-                snr, hops_away, channel, last_heard, since, node_data,
-                created, last_updated
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ''', (
-                node_id, long_name, short_name, hw_model, public_key, role,
-                position_lat, position_lon, position_alt,
-                battery_level, channel_util, air_util_tx,
-                snr, hops_away, channel, last_heard_ts, since_ts, json.dumps(node_data),
-                created_timestamp
-            ))
+            # Existing rows keep their created timestamp, the scalar columns follow node_data.
+            # Rows whose node_data is unchanged are left alone so polling doesn't rewrite the whole table.
+            cursor.executemany('''
+            INSERT INTO nodes (id, node_data, created, last_updated)
+            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(id) DO UPDATE SET
+                node_data = excluded.node_data,
+                last_updated = CURRENT_TIMESTAMP
+            WHERE nodes.node_data IS NOT excluded.node_data
+            ''', rows)
         
-        print(f"Saved {len(data['Nodes'])} nodes to database")
+        cursor.execute("COMMIT")
+    except Exception:
+        cursor.execute("ROLLBACK")
+        raise
+    
+    owner_written = bool(data.get("Owner"))
+    node_count = len(data.get("Nodes") or {})
+    logger.debug("Saved owner=%s, %s, %d nodes to database", owner_written, info_types, node_count)
+    return owner_written, len(info_types), node_count
+
+def _get_db(db_path: str) -> sqlite3.Connection:
+    """Return the writer's connection for a database file, opening it and creating the tables once."""
+    if db_path not in _db_connections:
+        _db_connections[db_path] = _open_db(db_path)
+    return _db_connections[db_path]
+
+def _close_db() -> None:
+    """Close every connection held by the writer thread."""
+    while _db_connections:
+        _, conn = _db_connections.popitem()
+        conn.close()
+
+def _db_worker() -> None:
+    """Drain the write queue on one long-lived connection per database file."""
+    while True:
+        data, db_path, done = _db_queue.get()
+        try:
+            done.set_result(_write_json_objects(_get_db(db_path), data))
+        except Exception as e:
+            logger.error("Error saving device information: %s", e)
+            done.set_exception(e)
+        finally:
+            _db_queue.task_done()
+
+def queue_json_objects(data: Dict[str, Any], db_path: str = "meshtastic.db") -> Future:
+    """
+    Queue each component to be saved to a SQLite database by a background thread
     
-    conn.commit()
-    conn.close()
+    Args:
+        data: Dictionary with extracted Meshtastic data
+        db_path: Path to the SQLite database file
+        
+    Returns:
+        Future resolved with save_json_objects' result once the write commits,
+        or with the exception if it fails
+    """
+    global _db_thread
+    with _db_thread_lock:
+        if _db_thread is None:
+            _db_thread = threading.Thread(target=_db_worker, name="mcptastic-db", daemon=True)
+            _db_thread.start()
+            # atexit runs last-registered first: flush the queued writes, then close the connections
+            atexit.register(_close_db)
+            atexit.register(flush_json_objects)
+    done: Future = Future()
+    _db_queue.put((data, db_path, done))
+    return done
+
+def flush_json_objects() -> None:
+    """Block until every queued write has been committed."""
+    _db_queue.join()
+
+# Config field names repeat across sections and configure calls, so cache the conversions
+@lru_cache(maxsize=1024)
+def _camel_to_snake(name: str) -> str:
+    return meshtastic.util.camel_to_snake(name)
+
+@lru_cache(maxsize=1024)
+def _snake_to_camel(name: str) -> str:
+    return meshtastic.util.snake_to_camel(name)
 
 def splitCompoundName(comp_name: str) -> List[str]:
     """Split compound (dot separated) preference name into parts"""
@@ -227,13 +399,15 @@ def splitCompoundName(comp_name: str) -> List[str]:
 
 def traverseConfig(config_root, config, interface_config) -> bool:
     """Iterate through current config level preferences and either traverse deeper if preference is a dict or set preference"""
-    snake_name = meshtastic.util.camel_to_snake(config_root)
-    for pref in config:
-        pref_name = f"{snake_name}.{pref}"
-        if isinstance(config[pref], dict):
-            traverseConfig(pref_name, config[pref], interface_config)
-        else:
-            setPref(interface_config, pref_name, config[pref])
+    stack = [(_camel_to_snake(config_root), config)]
+    while stack:
+        snake_name, node = stack.pop()
+        for pref, value in node.items():
+            pref_name = f"{snake_name}.{pref}"
+            if isinstance(value, dict):
+                stack.append((_camel_to_snake(pref_name), value))
+            else:
+                setPref(interface_config, pref_name, value)
 
     return True
 
@@ -242,8 +416,8 @@ def setPref(config, comp_name, raw_val) -> bool:
 
     name = splitCompoundName(comp_name)
 
-    snake_name = meshtastic.util.camel_to_snake(name[-1])
-    camel_name = meshtastic.util.snake_to_camel(name[-1])
+    snake_name = _camel_to_snake(name[-1])
+    camel_name = _snake_to_camel(name[-1])
     uni_name = camel_name if mt_config.camel_case else snake_name
 
     objDesc = config.DESCRIPTOR
@@ -251,7 +425,7 @@ def setPref(config, comp_name, raw_val) -> bool:
     config_type = objDesc.fields_by_name.get(name[0])
     if config_type and config_type.message_type is not None:
         for name_part in name[1:-1]:
-            part_snake_name = meshtastic.util.camel_to_snake((name_part))
+            part_snake_name = _camel_to_snake(name_part)
             config_part = getattr(config, config_type.name)
             config_type = config_type.message_type.fields_by_name.get(part_snake_name)
     pref = None
@@ -295,12 +469,15 @@ def setPref(config, comp_name, raw_val) -> bool:
 
     # repeating fields need to be handled with append, not setattr
     if pref.label != pref.LABEL_REPEATED:
+        if config_type.message_type is not None:
+            target, attr_name = getattr(config_part, config_type.name), pref.name
+        else:
+            target, attr_name = config_part, snake_name
+        if getattr(target, attr_name, None) == val:
+            # Already set, skip the protobuf write and the log line
+            return True
         try:
-            if config_type.message_type is not None:
-                config_values = getattr(config_part, config_type.name)
-                setattr(config_values, pref.name, val)
-            else:
-                setattr(config_part, snake_name, val)
+            setattr(target, attr_name, val)
         except TypeError:
             # The setter didn't like our arg type guess try again as a string
             config_values = getattr(config_part, config_type.name)
@@ -308,18 +485,26 @@ def setPref(config, comp_name, raw_val) -> bool:
     elif type(val) == list:
         new_vals = [meshtastic.util.fromStr(x) for x in val]
         config_values = getattr(config, config_type.name)
-        getattr(config_values, pref.name)[:] = new_vals
+        field = getattr(config_values, pref.name)
+        if list(field) == new_vals:
+            return True
+        del field[:]
+        field.extend(new_vals)
     else:
         config_values = getattr(config, config_type.name)
         if val == 0:
             # clear values
             print(f"Clearing {pref.name} list")
-            del getattr(config_values, pref.name)[:]
+            config_values.ClearField(pref.name)
         else:
             print(f"Adding '{raw_val}' to the {pref.name} list")
-            cur_vals = [x for x in getattr(config_values, pref.name) if x not in [0, "", b""]]
-            cur_vals.append(val)
-            getattr(config_values, pref.name)[:] = cur_vals
+            field = getattr(config_values, pref.name)
+            # Placeholder entries are dropped, otherwise append in place rather than rebuilding the list
+            if any(x in (0, "", b"") for x in field):
+                cur_vals = [x for x in field if x not in (0, "", b"")]
+                del field[:]
+                field.extend(cur_vals)
+            field.append(val)
         return True
 
     prefix = f"{'.'.join(name[0:-1])}." if config_type.message_type is not None else ""
@@ -359,40 +544,23 @@ def ex_config(interface) -> str:
         if alt:
             configObj["location"]["alt"] = alt
 
-    config = MessageToDict(interface.localNode.localConfig)	#checkme - Used as a dictionary here and a string below
+    config = MessageToDict(interface.localNode.localConfig)
     if config:
-        # Convert inner keys to correct snake/camelCase
-        prefs = {}
-        for pref in config:
-            if mt_config.camel_case:
-                prefs[meshtastic.util.snake_to_camel(pref)] = config[pref]
-            else:
-                prefs[pref] = config[pref]
-            # mark base64 encoded fields as such
-            if pref == "security":
-                if 'privateKey' in prefs[pref]:
-                    prefs[pref]['privateKey'] = 'base64:' + prefs[pref]['privateKey']
-                if 'publicKey' in prefs[pref]:
-                    prefs[pref]['publicKey'] = 'base64:' + prefs[pref]['publicKey']
-                if 'adminKey' in prefs[pref]:
-                    for i in range(len(prefs[pref]['adminKey'])):
-                        prefs[pref]['adminKey'][i] = 'base64:' + prefs[pref]['adminKey'][i]
-        if mt_config.camel_case:
-            configObj["config"] = config		#Identical command here and 2 lines below?
-        else:
-            configObj["config"] = config
+        # mark base64 encoded fields as such
+        security = config.get("security")
+        if security:
+            if 'privateKey' in security:
+                security['privateKey'] = 'base64:' + security['privateKey']
+            if 'publicKey' in security:
+                security['publicKey'] = 'base64:' + security['publicKey']
+            if 'adminKey' in security:
+                security['adminKey'] = ['base64:' + key for key in security['adminKey']]
+        configObj["config"] = config
 
     module_config = MessageToDict(interface.localNode.moduleConfig)
     if module_config:
-        # Convert inner keys to correct snake/camelCase
-        prefs = {}
-        for pref in module_config:
-            if len(module_config[pref]) > 0:
-                prefs[pref] = module_config[pref]
-        if mt_config.camel_case:
-            configObj["module_config"] = prefs
-        else:
-            configObj["module_config"] = prefs
+        # Skip empty module sections
+        configObj["module_config"] = {k: v for k, v in module_config.items() if len(v) > 0}
 
     config_txt = "# start of Meshtastic configure yaml\n"		#checkme - "config" (now changed to config_out)
                                                                         #was used as a string here and a Dictionary above
@@ -407,49 +575,48 @@ def register_device_tools(mcp, interface_manager):
     @mcp.tool()
     async def get_info() -> str:
         """Returns information about the connected device."""
-        import io
-        import contextlib
-        
-        # Create a string buffer to capture output
-        string_buffer = io.StringIO()
-        
         iface = interface_manager.get_interface()
+        if iface is None:
+            try:
+                iface = await asyncio.to_thread(interface_manager.connect_default)
+            except TimeoutError as e:
+                # connect_default only raises ConnectTimeout
+                return json_dumps(e.as_dict())
+
+        # Reading the node db blocks, keep it off the event loop
+        dicts = await asyncio.to_thread(collect_device_info, iface)
+        # The sqlite write happens on the background writer thread, wait for it to commit
         try:
-            # Capture all stdout to our buffer
-            with contextlib.redirect_stdout(string_buffer):
-                iface.showInfo()
-            
-            # Get the captured output
-            info = string_buffer.getvalue()
-            dicts = parse_meshtastic_output(info)
-            save_json_objects(dicts)
-            return "Device information saved to database"
-        finally:
-            iface.close()
+            await asyncio.wrap_future(queue_json_objects(dicts))
+        except Exception as e:
+            return f"Error saving device information: {str(e)}"
+        return "Device information saved to database"
 
     @mcp.tool()
     async def get_support_info() -> str:
         """Returns support information about the connected device."""
-        
-        iface = interface_manager.get_interface()
-        try:
+
+        def _read_support_info() -> str:
             # Capture all stdout to our buffer
-            output_buffer = io.StringIO()
+            output_buffer = _ChunkWriter()
             with contextlib.redirect_stdout(output_buffer):
                 meshtastic.util.support_info()
             return output_buffer.getvalue()
-        finally:
-            iface.close()
+
+        return await asyncio.to_thread(_read_support_info)
 
     @mcp.tool()
     async def export_config() -> str:
         """Exports the configuration of the connected device as YAML."""
         
         iface = interface_manager.get_interface()
-        try:
-            return ex_config(iface)
-        finally:
-            iface.close()
+        if iface is None:
+            try:
+                iface = await asyncio.to_thread(interface_manager.connect_default)
+            except TimeoutError as e:
+                # connect_default only raises ConnectTimeout
+                return json_dumps(e.as_dict())
+        return await asyncio.to_thread(ex_config, iface)
 
     @mcp.tool()
     async def configure(yml: str) -> str:
@@ -460,8 +627,15 @@ def register_device_tools(mcp, interface_manager):
         """
         
         iface = interface_manager.get_interface()
-        out = ""
-        try:
+        if iface is None:
+            try:
+                iface = await asyncio.to_thread(interface_manager.connect_default)
+            except TimeoutError as e:
+                # connect_default only raises ConnectTimeout
+                return json_dumps(e.as_dict())
+
+        def _configure() -> str:
+            out = ""
             configuration = yaml.safe_load(yml)
             if "owner" in configuration:
                     out += f"Setting device owner to {configuration['owner']}"
@@ -518,7 +692,7 @@ def register_device_tools(mcp, interface_manager):
                             section, configuration["config"][section], localConfig
                         )
                         iface.getNode(id).writeConfig(
-                            meshtastic.util.camel_to_snake(section)
+                            _camel_to_snake(section)
                         )
 
                 if "module_config" in configuration:
@@ -530,7 +704,7 @@ def register_device_tools(mcp, interface_manager):
                             moduleConfig,
                         )
                         iface.getNode(id).writeConfig(
-                            meshtastic.util.camel_to_snake(section)
+                            _camel_to_snake(section)
                         )
 
                 iface.getNode(id).commitSettingsTransaction()
@@ -538,8 +712,13 @@ def register_device_tools(mcp, interface_manager):
 
         
             return out
+
+        # Each setOwner/setURL/writeConfig is a blocking round trip to the radio
+        try:
+            return await asyncio.to_thread(_configure)
         finally:
-            iface.close()        
+            # Even a partly applied configuration may have renamed the device
+            interface_manager.invalidate_static_info()
     
     @mcp.tool()
     async def set_serial_log(file: str) -> str:
@@ -1,45 +1,362 @@
 # This module provides shared functionality for managing and caching interfaces.
 
-from typing import Optional
-import mcp
+import logging
+import os
+import socket
+import threading
+import time
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
 import meshtastic
 import meshtastic.mesh_interface
-import meshtastic.tcp_interface
-import meshtastic.ble_interface
-import meshtastic.serial_interface
+from pubsub import pub
+
+logger = logging.getLogger(__name__)
+
+# Device the tools connect to when nothing is connected yet, set MESHTASTIC_HOST to a fixed IP to skip mDNS
+DEFAULT_HOSTNAME = os.environ.get("MESHTASTIC_HOST", "meshtastic.local")
+
+# Seconds a fallback connection to the default device may wait on the radio,
+# instead of the meshtastic library's five minute default
+DEFAULT_CONNECT_TIMEOUT = 30
+
+class ConnectTimeout(TimeoutError):
+    """Raised when a fallback connection gets no answer within DEFAULT_CONNECT_TIMEOUT seconds.
+
+    main.py and the package imports can load this module twice, so callers in other
+    modules catch TimeoutError rather than this class.
+    """
+
+    def __init__(self, hostname: str, timeout: int, reason: Exception):
+        super().__init__(f"Timed out connecting to {hostname} after {timeout} seconds: {reason}")
+        self.hostname = hostname
+        self.timeout = timeout
+
+    def as_dict(self) -> dict:
+        """The structured error the tools return for a timed out connection."""
+        return {"status": "error", "error": "timeout", "hostname": self.hostname, "timeout": self.timeout, "message": str(self)}
+
+# How long a resolved mDNS name is trusted before it is looked up again
+DNS_CACHE_TTL = 60
+
+@lru_cache(maxsize=32)
+def _resolve_cached(hostname: str, ttl_bucket: int) -> str:
+    return socket.gethostbyname(hostname)
+
+def resolve_host(hostname: str) -> str:
+    """Resolve a ``.local`` mDNS hostname to an IP, memoized for DNS_CACHE_TTL seconds.
+
+    Other hostnames are returned unchanged, as is a ``.local`` name that fails to resolve
+    so the interface reports the connection error itself.
+    """
+    if not hostname.endswith(".local"):
+        return hostname
+    try:
+        return _resolve_cached(hostname, int(time.monotonic() // DNS_CACHE_TTL))
+    except OSError:
+        return hostname
+
+# Keepalive probing so a radio that vanished is noticed within about a minute
+TCP_KEEPALIVE_IDLE = 30
+TCP_KEEPALIVE_INTERVAL = 10
+TCP_KEEPALIVE_COUNT = 3
+
+def _tune_socket(sock) -> None:
+    """Disable Nagle and enable keepalive on a radio socket, skipping options the platform lacks."""
+    if sock is None:
+        return
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    for name, value in (("TCP_KEEPIDLE", TCP_KEEPALIVE_IDLE), ("TCP_KEEPINTVL", TCP_KEEPALIVE_INTERVAL), ("TCP_KEEPCNT", TCP_KEEPALIVE_COUNT)):
+        if hasattr(socket, name):
+            sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, name), value)
+
+def _tcp_interface(h, d, np_, cn, pn, nn, **kw):
+    import meshtastic.tcp_interface
+    iface = meshtastic.tcp_interface.TCPInterface(resolve_host(h), d, np_, cn, pn, nn, **kw)
+    try:
+        _tune_socket(getattr(iface, "socket", None))
+    except OSError as e:
+        logger.debug("Could not tune socket for %s: %s", h, e)
+    return iface
+
+def _ble_interface(h, d, np_, cn, pn, nn, **kw):
+    # bleak is slow to import, only load it once a BLE device is actually used
+    import meshtastic.ble_interface
+    return meshtastic.ble_interface.BLEInterface(h, np_, d, nn, **kw)
+
+def _serial_interface(h, d, np_, cn, pn, nn, **kw):
+    import meshtastic.serial_interface
+    return meshtastic.serial_interface.SerialInterface(h, d, np_, cn, nn, **kw)
+
+# Interfaces other than the current one are closed after this many idle seconds
+IDLE_TIMEOUT = 300
+# How often the background reaper looks for idle interfaces
+IDLE_REAP_INTERVAL = 60
+
+# Interface constructors by connection type, each takes
+# (hostname, debugOut, noProto, connectNow, portNumber, noNodes, **kwargs)
+_IFACE_CTORS = {
+    "tcp": _tcp_interface,
+    "ble": _ble_interface,
+    "serial": _serial_interface,
+}
 
 class InterfaceManager:
     def __init__(self):
         """Initialize the InterfaceManager with no cached interface."""
+        # Every open interface keyed by (hostname, connection_type)
+        self._cache: Dict[Tuple[str, str], meshtastic.mesh_interface.MeshInterface] = {}
+        self._last_used: Dict[Tuple[str, str], float] = {}
+        # The most recently selected interface, returned by get_interface() with no arguments
         self._cached_iface = None
         self._cached_hostname = None
+        self._cached_type = None
+        self._lock = threading.Lock()
+        self._prewarmed = False
+        # Background thread closing idle interfaces while no tool calls come in
+        self._reaper: Optional[threading.Thread] = None
+        self._reaper_stop = threading.Event()
+        # pubsub listeners kept subscribed while any interface is open
+        self._listeners: List[Tuple[Callable, str]] = []
+        self._subscribed = False
+        # Device values the mesh tools serve from memory, name -> (expiry, interface, key, value)
+        self.static_cache: Dict[str, Tuple[float, meshtastic.mesh_interface.MeshInterface, object, object]] = {}
 
-    def set_interface(self, hostname: str, connection_type: str = "tcp", debugOut=None, noProto: bool = False, connectNow: bool = True, portNumber: int = 4403, noNodes: bool = False) -> Optional[meshtastic.mesh_interface.MeshInterface]:
+    def set_interface(self, hostname: str, connection_type: str = "tcp", debugOut=None, noProto: bool = False, connectNow: bool = True, portNumber: int = 4403, noNodes: bool = False, timeout: Optional[int] = None) -> Optional[meshtastic.mesh_interface.MeshInterface]:
         """Set and cache the interface based on the hostname and connection type.
 
+        Interfaces to other devices stay open, so switching back and forth between
+        devices doesn't reconnect. An already cached interface that is still
+        connected is returned as-is. Other interfaces left idle for IDLE_TIMEOUT
+        seconds are closed, here and by a background reaper every IDLE_REAP_INTERVAL
+        seconds.
+
         Args:
             hostname (str): The hostname to connect to.
             connection_type (str): The type of connection (e.g., "tcp" or "ble"). Defaults to "tcp".
+            timeout (int, optional): Seconds to wait on the radio before giving up. Defaults to the meshtastic library default.
         """
-        if self._cached_iface:
-            self._cached_iface.close()
+        key = (hostname, connection_type)
+        with self._lock:
+            iface = self._cache.get(key)
+            if iface is not None and not iface.isConnected.is_set():
+                # The device dropped the connection, replace it
+                iface.close()
+                iface = None
+
+            if iface is None:
+                ctor = _IFACE_CTORS.get(connection_type)
+                if ctor is None:
+                    raise ValueError(f"Unsupported connection type: {connection_type}")
+                # Subscribe first so packets received while connecting are not missed
+                self._subscribe_locked()
+                kwargs = {} if timeout is None else {"timeout": timeout}
+                iface = ctor(hostname, debugOut, noProto, connectNow, portNumber, noNodes, **kwargs)
+                self._cache[key] = iface
 
-        if connection_type == "tcp":
-            self._cached_iface = meshtastic.tcp_interface.TCPInterface(hostname, debugOut, noProto,connectNow,portNumber,noNodes)
-        elif connection_type == "ble":
-            self._cached_iface = meshtastic.ble_interface.BLEInterface(hostname,noProto,debugOut,noNodes)
-        elif connection_type == "serial":
-            self._cached_iface = meshtastic.serial_interface.SerialInterface(hostname, debugOut, noProto,connectNow,noNodes)
-        else:
-            raise ValueError(f"Unsupported connection type: {connection_type}")
+            self._last_used[key] = time.monotonic()
+            self._cached_iface = iface
+            self._cached_hostname = hostname
+            self._cached_type = connection_type
+            self._close_idle_locked(IDLE_TIMEOUT)
+            self._start_reaper_locked()
+            return iface
 
-        self._cached_hostname = hostname
-        return self._cached_iface
+    def get_interface(self, hostname: Optional[str] = None, connection_type: str = "tcp") -> Optional[meshtastic.mesh_interface.MeshInterface]:
+        """Retrieve a cached interface.
 
-    def get_interface(self) -> Optional[meshtastic.mesh_interface.MeshInterface]:
-        """Retrieve the cached interface if it matches the hostname.
+        Args:
+            hostname (str, optional): The hostname to look up. Defaults to the most recently set interface.
+            connection_type (str): The type of connection. Defaults to "tcp".
 
         Returns:
             Optional[meshtastic.interface.Interface]: The cached interface or None if no match.
         """
-        return self._cached_iface
\ No newline at end of file
+        if hostname is None:
+            return self._cached_iface
+        key = (hostname, connection_type)
+        if key in self._cache:
+            self._last_used[key] = time.monotonic()
+        return self._cache.get(key)
+
+    def _connect_with_timeout(self, hostname: str, connection_type: str) -> Optional[meshtastic.mesh_interface.MeshInterface]:
+        try:
+            return self.set_interface(hostname, connection_type, timeout=DEFAULT_CONNECT_TIMEOUT)
+        except (TimeoutError, meshtastic.mesh_interface.MeshInterface.MeshInterfaceError) as e:
+            raise ConnectTimeout(hostname, DEFAULT_CONNECT_TIMEOUT, e) from e
+
+    def connect_default(self) -> Optional[meshtastic.mesh_interface.MeshInterface]:
+        """Open DEFAULT_HOSTNAME over TCP for tools called before anything was connected.
+
+        Raises:
+            ConnectTimeout: The device did not answer within DEFAULT_CONNECT_TIMEOUT seconds.
+        """
+        return self._connect_with_timeout(DEFAULT_HOSTNAME, "tcp")
+
+    def get_connected_interface(self, default_hostname: str = DEFAULT_HOSTNAME, default_type: str = "tcp") -> Optional[meshtastic.mesh_interface.MeshInterface]:
+        """Return the current interface, reconnecting it if the device dropped the connection.
+
+        When nothing has been connected yet the default device is opened. Either
+        connection waits at most DEFAULT_CONNECT_TIMEOUT seconds and raises
+        ConnectTimeout otherwise.
+
+        Args:
+            default_hostname (str): The hostname to connect to when no interface is set. Defaults to DEFAULT_HOSTNAME.
+            default_type (str): The connection type used with default_hostname. Defaults to "tcp".
+        """
+        iface = self._cached_iface
+        if iface is not None and iface.isConnected.is_set():
+            return iface
+        if iface is None:
+            return self._connect_with_timeout(default_hostname, default_type)
+        return self._connect_with_timeout(self._cached_hostname, self._cached_type)
+
+    def reconnect(self, iface: meshtastic.mesh_interface.MeshInterface) -> Optional[meshtastic.mesh_interface.MeshInterface]:
+        """Replace a broken current interface with a fresh connection to the same device.
+
+        When another caller already replaced it, the current interface is returned instead.
+
+        Args:
+            iface: The interface whose connection failed.
+        """
+        with self._lock:
+            replaced = iface is self._cached_iface
+            if replaced:
+                hostname, connection_type = self._cached_hostname, self._cached_type
+                self._cache.pop((hostname, connection_type), None)
+                self._last_used.pop((hostname, connection_type), None)
+        if not replaced:
+            return self.get_connected_interface()
+        try:
+            iface.close()
+        except Exception as e:
+            logger.debug("Error closing broken interface: %s", e)
+        return self.set_interface(hostname, connection_type)
+
+    def prewarm(self, hostname: str = DEFAULT_HOSTNAME, connection_type: str = "tcp") -> None:
+        """Connect to a device on a background thread so the first tool call finds a warm interface.
+
+        Only the first call starts a connection, later calls do nothing. A failed connection
+        is logged and left for the tools to retry.
+
+        Args:
+            hostname (str): The hostname to connect to. Defaults to DEFAULT_HOSTNAME.
+            connection_type (str): The type of connection. Defaults to "tcp".
+        """
+        with self._lock:
+            if self._prewarmed:
+                return
+            self._prewarmed = True
+
+        def _connect():
+            try:
+                self.set_interface(hostname, connection_type)
+            except Exception as e:
+                logger.warning("Could not pre-connect to %s: %s", hostname, e)
+
+        threading.Thread(target=_connect, name="mcptastic-prewarm", daemon=True).start()
+
+    def close(self, hostname: Optional[str] = None, connection_type: str = "tcp") -> None:
+        """Close one cached interface, or every cached interface when no hostname is given.
+
+        Args:
+            hostname (str, optional): The hostname to close. Defaults to closing all interfaces.
+            connection_type (str): The type of connection. Defaults to "tcp".
+        """
+        if hostname is None:
+            self.close_all()
+            return
+        with self._lock:
+            iface = self._cache.pop((hostname, connection_type), None)
+            self._last_used.pop((hostname, connection_type), None)
+            if iface is not None:
+                iface.close()
+            if iface is not None and iface is self._cached_iface:
+                self._cached_iface = None
+                self._cached_hostname = None
+                self._cached_type = None
+            if not self._cache:
+                self._unsubscribe_locked()
+
+    def close_all(self) -> None:
+        """Close every cached interface. Called once on server shutdown."""
+        self._reaper_stop.set()
+        with self._lock:
+            self._reaper = None
+            for iface in self._cache.values():
+                iface.close()
+            self._cache.clear()
+            self._last_used.clear()
+            self._cached_iface = None
+            self._cached_hostname = None
+            self._cached_type = None
+            self._unsubscribe_locked()
+
+    def close_idle(self, idle_timeout: float = IDLE_TIMEOUT) -> None:
+        """Close every interface except the current one that has been unused for idle_timeout seconds.
+
+        Args:
+            idle_timeout (float): Seconds an interface may sit unused. Defaults to IDLE_TIMEOUT.
+        """
+        with self._lock:
+            self._close_idle_locked(idle_timeout)
+
+    def _close_idle_locked(self, idle_timeout: float) -> None:
+        cutoff = time.monotonic() - idle_timeout
+        for key, last_used in list(self._last_used.items()):
+            if last_used < cutoff and self._cache.get(key) is not self._cached_iface:
+                iface = self._cache.pop(key, None)
+                del self._last_used[key]
+                if iface is None:
+                    continue
+                try:
+                    iface.close()
+                except Exception as e:
+                    logger.warning("Error closing idle interface %s: %s", key[0], e)
+
+    def invalidate_static_info(self) -> None:
+        """Drop the cached owner names and node info after a tool changed them on the device."""
+        self.static_cache.clear()
+
+    def add_listener(self, listener: Callable, topic: str) -> None:
+        """Subscribe a pubsub listener to topic whenever an interface is open.
+
+        The listener is unsubscribed once the last interface is closed, so a closed
+        server stops handling radio packets. pubsub only keeps weak references, the
+        caller must keep the listener alive.
+
+        Args:
+            listener (Callable): The pubsub listener.
+            topic (str): The pubsub topic, e.g. "meshtastic.receive".
+        """
+        with self._lock:
+            self._listeners.append((listener, topic))
+            if self._subscribed:
+                pub.subscribe(listener, topic)
+
+    def _subscribe_locked(self) -> None:
+        if self._subscribed:
+            return
+        for listener, topic in self._listeners:
+            pub.subscribe(listener, topic)
+        self._subscribed = True
+
+    def _unsubscribe_locked(self) -> None:
+        if not self._subscribed:
+            return
+        for listener, topic in self._listeners:
+            pub.unsubscribe(listener, topic)
+        self._subscribed = False
+
+    def _start_reaper_locked(self) -> None:
+        if self._reaper is not None:
+            return
+        self._reaper_stop.clear()
+        self._reaper = threading.Thread(target=self._reap_idle, name="mcptastic-idle-reaper", daemon=True)
+        self._reaper.start()
+
+    def _reap_idle(self) -> None:
+        """Close idle interfaces every IDLE_REAP_INTERVAL seconds until close_all() is called."""
+        while not self._reaper_stop.wait(IDLE_REAP_INTERVAL):
+            self.close_idle()
@@ -1,7 +1,7 @@
 # Location and position-related tools
-import json
+import asyncio
 import meshtastic
-from utils import get_location_from_ip
+from utils import get_location_from_ip, json_dumps
 
 def register_location_tools(mcp, interface_manager):
     """Register all location-related tools with MCP."""
@@ -9,29 +9,33 @@ def register_location_tools(mcp, interface_manager):
     @mcp.tool()
     async def tcp_gps() -> str:
         """Looks up the location of the device via its LAN connection and sets the device's location if none is present."""
+        # Reuse the shared interface, only open one if nothing is connected yet
+        iface = interface_manager.get_interface()
+        if iface is None:
+            try:
+                iface = await asyncio.to_thread(interface_manager.connect_default)
+            except TimeoutError as e:
+                # connect_default only raises ConnectTimeout
+                return json_dumps(e.as_dict())
         try:
             # First try to get position from Meshtastic device
-            iface = interface_manager.get_interface()
             my_node_num = iface.myInfo.my_node_num
             position = iface.nodesByNum[my_node_num].get("position")
             
             # If position not available or incomplete from radio, use IP geolocation
             if position.gps_mode != "ENABLED":
                 ip_location = await get_location_from_ip()
-                return json.dumps(ip_location, indent=4)
+                return json_dumps(ip_location)
             else:
-                return json.dumps(position, indent=4)
+                return json_dumps(position)
         except Exception as e:
             # If anything fails, fall back to IP-based location
             ip_location = await get_location_from_ip()
             iface.localNode.localConfig.position.gps_mode = "ENABLED"
             iface.localNode.localConfig.position.fixed_position = True
-            iface.localNode.setFixedPosition(ip_location["lat"], ip_location["lon"], ip_location.get("altitude", 0))
-            iface.localNode.writeConfig("position")
-            return json.dumps(ip_location, indent=4)
-        finally:
-            if 'iface' in locals():
-                iface.close()
+            await asyncio.to_thread(iface.localNode.setFixedPosition, ip_location["lat"], ip_location["lon"], ip_location.get("altitude", 0))
+            await asyncio.to_thread(iface.localNode.writeConfig, "position")
+            return json_dumps(ip_location)
     
     @mcp.tool()
     async def set_fixed_position(lat: float, lon: float, alt: float = 0) -> str:
@@ -43,10 +47,13 @@ def register_location_tools(mcp, interface_manager):
             alt (float, optional): Altitude. Defaults to 0.
         """
         iface = interface_manager.get_interface()
-        try:
-            iface.localNode.setFixedPosition(lat, lon, alt)
-            return "Fixed position set successfully"
-        finally:
-            iface.close()
+        if iface is None:
+            try:
+                iface = await asyncio.to_thread(interface_manager.connect_default)
+            except TimeoutError as e:
+                # connect_default only raises ConnectTimeout
+                return json_dumps(e.as_dict())
+        await asyncio.to_thread(iface.localNode.setFixedPosition, lat, lon, alt)
+        return "Fixed position set successfully"
     
     return mcp
\ No newline at end of file
@@ -1,4 +1,5 @@
 # Main entry point that initializes MCP and imports all tools
+import atexit
 import sys
 from mcp.server.fastmcp import FastMCP
 
@@ -12,10 +13,13 @@ from tcp import register_tcp
 from srl import register_serial
 from node import register_node_tools # Import for node tools
 from interface_manager import InterfaceManager
+from utils import use_mesh_executor
 
 # Initialize FastMCP server
-mcp = FastMCP("MCPtastic")
+mcp = FastMCP("MCPtastic", lifespan=use_mesh_executor)
 interface_manager = InterfaceManager()
+# Tools share one long-lived interface; only tear it down when the server exits
+atexit.register(interface_manager.close_all)
 
 # Register all tools with MCP
 register_device_tools(mcp, interface_manager)
@@ -28,5 +32,7 @@ register_node_tools(mcp, interface_manager) # Register node tools
 register_version(mcp)
 
 if __name__ == "__main__":
+    # Connect to the default radio while the server starts so the first tool call doesn't wait on it
+    interface_manager.prewarm()
     # Initialize and run the server
     mcp.run(transport='stdio')
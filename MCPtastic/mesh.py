@@ -1,91 +1,318 @@
+import atexit
 import datetime
-import json
+import logging
+import queue
 import sys
 import os
-from typing import List, Optional, Union
-import meshtastic
-import meshtastic.tcp_interface
+import threading
+from typing import Any, Callable, List, Optional, Union
 from meshtastic import BROADCAST_ADDR
 import asyncio
+import base64
+import collections
 import hashlib
 import functools
+import inspect
+import math
+import time
 
-# Add parent directory to path to enable local imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from MCPtastic.utils import utf8len
+# main.py imports this file as a top-level module, the parent directory is only
+# needed on the path then so the MCPtastic package itself can be found
+if not __package__:
+    _parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if _parent_dir not in sys.path:
+        sys.path.append(_parent_dir)
+from MCPtastic.utils import json_dumps, utf8len
 from MCPtastic.interface_manager import InterfaceManager
 
+logger = logging.getLogger(__name__)
+
+# Fire-and-forget sends, drained in order by one background thread
+_send_queue: "queue.Queue[Callable[[], Any]]" = queue.Queue()
+_send_thread: Optional[threading.Thread] = None
+_send_thread_lock = threading.Lock()
+
+def _send_worker() -> None:
+    """Run queued sends back-to-back on the interface they were queued for."""
+    while True:
+        send = _send_queue.get()
+        try:
+            send()
+        except Exception as e:
+            logger.error("Error sending queued packet: %s", e)
+        finally:
+            _send_queue.task_done()
+
+def queue_send(send: Callable[[], Any]) -> None:
+    """
+    Queue a send to run on the background sender thread
+    
+    Args:
+        send: Callable that performs the send on an interface
+    """
+    global _send_thread
+    with _send_thread_lock:
+        if _send_thread is None:
+            _send_thread = threading.Thread(target=_send_worker, name="mcptastic-send", daemon=True)
+            _send_thread.start()
+            # Let queued packets go out before the interface is closed at exit
+            atexit.register(flush_sends)
+    _send_queue.put(send)
+
+def flush_sends() -> None:
+    """Block until every queued send has run."""
+    _send_queue.join()
+
+@functools.lru_cache(maxsize=256)
+def _iso_to_epoch(s: str) -> int:
+    """Convert an ISO 8601 timestamp to epoch seconds, memoized for repeated waypoint expiries.
+
+    Timestamps without an offset are taken as UTC rather than the server's local time.
+    """
+    parsed = datetime.datetime.fromisoformat(s)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return int(parsed.timestamp())
+
+# Bumped whenever the radio reports a packet or node change, so rendered node tables know they are stale
+_nodes_version = 0
+
+# Most recent packets from the radio, drained by recv_packets
+RECEIVED_PACKETS_MAX = 500
+_received_packets = collections.deque(maxlen=RECEIVED_PACKETS_MAX)
+
+# (event loop, asyncio.Event) pairs of recv_packets calls waiting for a packet
+_packet_waiters = set()
+_packet_waiters_lock = threading.Lock()
+
+def _on_receive(packet, interface) -> None:
+    global _nodes_version
+    _nodes_version += 1
+    _received_packets.append(packet)
+    # Called on the meshtastic reader thread, wake the waiters on their own loops
+    with _packet_waiters_lock:
+        waiters = list(_packet_waiters)
+    for loop, event in waiters:
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            # The waiter's loop has already closed
+            pass
+
+async def _wait_for_packet(timeout: float) -> None:
+    """Wait up to timeout seconds for _on_receive to buffer a packet."""
+    waiter = (asyncio.get_running_loop(), asyncio.Event())
+    with _packet_waiters_lock:
+        _packet_waiters.add(waiter)
+    try:
+        # A packet may have arrived before the waiter was registered
+        if not _received_packets:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        with _packet_waiters_lock:
+            _packet_waiters.discard(waiter)
+
+def _packet_for_json(value):
+    """Drop the raw protobuf from a received packet and base64 encode binary payloads."""
+    if isinstance(value, dict):
+        return {k: _packet_for_json(v) for k, v in value.items() if k != "raw"}
+    if isinstance(value, (list, tuple)):
+        return [_packet_for_json(v) for v in value]
+    if isinstance(value, (bytes, bytearray)):
+        return base64.b64encode(value).decode()
+    return value
+
+def _on_node_updated(node, interface) -> None:
+    global _nodes_version
+    _nodes_version += 1
+
+def _node_lines(iface, includeSelf: bool = True, showFields: Optional[List[str]] = None):
+    """Yield one JSON line per known node, keeping only the dotted showFields paths when given."""
+    my_num = iface.myInfo.my_node_num if iface.myInfo else None
+    for node in list((iface.nodesByNum or {}).values()):
+        if not includeSelf and node.get("num") == my_num:
+            continue
+        if showFields:
+            record = {}
+            for field in showFields:
+                value = node
+                for part in field.split("."):
+                    value = value.get(part) if isinstance(value, dict) else None
+                record[field] = value
+            node = record
+        yield json_dumps(node, indent=False) + "\n"
+
+# send_heartbeat's reply never changes, encode it once
+_HEARTBEAT_QUEUED = json_dumps({"status": "queued", "message": "Heartbeat queued"})
+
+# Seconds a rendered show_nodes table is reused, short so its relative "Since" column stays accurate
+NODE_TABLE_TTL = 5
+
+# Maximum size of a Meshtastic text message in bytes
+MAX_TEXT_SIZE = 192  # they told me 237 bytes but that appears to have been a lie
+
+def _chunk_text(text: Union[str, bytes], max_size: int) -> List[str]:
+    """Split text into "[i/n] "-prefixed chunks of at most max_size UTF-8 bytes.
+
+    Works on the encoded bytes, breaking at the last whitespace that fits and never
+    inside a multi-byte character. Callers that already encoded the text can pass the
+    UTF-8 bytes to skip encoding it again.
+    """
+    encoded = text.encode('utf-8') if isinstance(text, str) else text
+    # Reserve room for the "[i/n] " prefix, growing it if the chunk count gains a digit
+    digits = len(str(len(encoded) // max_size + 1))
+    while True:
+        effective_max_size = max_size - (4 + 2 * digits)
+        if effective_max_size < 4:
+            raise ValueError("Cannot chunk message - maximum size is too small")
+        chunks = []
+        start = 0
+        while start < len(encoded):
+            end = min(start + effective_max_size, len(encoded))
+            if end < len(encoded):
+                # Back off continuation bytes so a character is never split
+                while (encoded[end] & 0xC0) == 0x80:
+                    end -= 1
+                space = max(encoded.rfind(b" ", start, end), encoded.rfind(b"\n", start, end), encoded.rfind(b"\t", start, end))
+                if space > start:
+                    end = space + 1
+            chunks.append(encoded[start:end].decode('utf-8'))
+            start = end
+        if len(str(len(chunks))) <= digits:
+            break
+        digits += 1
+    total_chunks = len(chunks)
+    return [f"[{i+1}/{total_chunks}] {chunk}" for i, chunk in enumerate(chunks)]
+
+# Seconds the owner names, node info and public key are served from memory before being read again
+STATIC_INFO_TTL = 30
+
 def register_mesh_tools(mcp, iface_manager: InterfaceManager) -> None:
     """Register all mesh-related tools with MCP."""
 
+    async def _get_iface():
+        """Return the shared interface, only leaving the event loop when it has to (re)connect."""
+        iface = iface_manager.get_interface()
+        if iface is None or not iface.isConnected.is_set():
+            iface = await asyncio.to_thread(iface_manager.get_connected_interface)
+        return iface
+
+    async def _radio_call(method, *args, **kwargs):
+        """Call an interface method off the event loop, reconnecting and retrying once if the socket broke."""
+        iface = await _get_iface()
+        try:
+            return await asyncio.to_thread(getattr(iface, method), *args, **kwargs)
+        except OSError as e:
+            logger.warning("Radio call %s failed (%s), reconnecting", method, e)
+            iface = await asyncio.to_thread(iface_manager.reconnect, iface)
+            return await asyncio.to_thread(getattr(iface, method), *args, **kwargs)
+
+    # pubsub only keeps weak references, the listeners are module level so they stay alive.
+    # The interface manager drops the subscriptions once every interface is closed.
+    iface_manager.add_listener(_on_receive, "meshtastic.receive")
+    iface_manager.add_listener(_on_node_updated, "meshtastic.node.updated")
+
+    # Lives on the interface manager so the node and device tools can invalidate it
+    static_cache = iface_manager.static_cache
+
+    def _cache_get(name, iface, key=None):
+        """Return a cached value, or None once its ttl passes or the interface or key changed."""
+        entry = static_cache.get(name)
+        if entry is not None and entry[0] > time.monotonic() and entry[1] is iface and entry[2] == key:
+            return entry[3]
+        return None
+
+    def _cache_put(name, iface, value, key=None, ttl=STATIC_INFO_TTL):
+        static_cache[name] = (time.monotonic() + ttl, iface, key, value)
+        return value
+
+    def _cached(name, iface, read, ttl=STATIC_INFO_TTL):
+        """Return a static device value, re-reading it once ttl passes or the interface changes."""
+        value = _cache_get(name, iface)
+        if value is None:
+            value = _cache_put(name, iface, read(), ttl=ttl)
+        return value
+
+    def _iface_tool(fn):
+        """Turn an async fn(iface, ...) into a tool on the shared interface that reports errors as JSON."""
+        async def tool(*args, **kwargs):
+            try:
+                return await fn(await _get_iface(), *args, **kwargs)
+            except TimeoutError as e:
+                # A ConnectTimeout from the interface manager carries its own structured error
+                return json_dumps(e.as_dict() if hasattr(e, "as_dict") else {"status": "error", "message": str(e)})
+            except Exception as e:
+                return json_dumps({"status": "error", "message": str(e)})
+        functools.wraps(fn)(tool)
+        del tool.__wrapped__
+        # Advertise the tool's own parameters, without the injected interface
+        signature = inspect.signature(fn)
+        tool.__signature__ = signature.replace(parameters=list(signature.parameters.values())[1:])
+        return tool
+
+    def _static_tool(name=None, as_json=False, ttl=STATIC_INFO_TTL):
+        """Turn fn(iface) into a zero-argument tool on the shared interface, cached under name when given."""
+        def decorator(fn):
+            async def tool() -> str:
+                try:
+                    iface = await _get_iface()
+                    read = (lambda: json_dumps(fn(iface))) if as_json else (lambda: fn(iface))
+                    return read() if name is None else _cached(name, iface, read, ttl)
+                except Exception as e:
+                    return f"Error: {str(e)}"
+            functools.wraps(fn)(tool)
+            # Keep the zero-argument signature for the tool schema instead of exposing iface
+            del tool.__wrapped__
+            return tool
+        return decorator
+
     @mcp.tool()
-    async def get_long_name() -> str:
+    @_static_tool("long_name")
+    def get_long_name(iface):
         """Get the long name of the device."""
-        try:
-            iface = iface_manager.get_interface()
-            if iface is None:
-                iface = iface_manager.set_interface("meshtastic.local", "tcp")
-            return iface.getLongName()
-        except Exception as e:
-            return f"Error: {str(e)}"
-        finally:
-            if iface:
-                iface.close()
+        return iface.getLongName()
 
     @mcp.tool()
-    async def get_short_name() -> str:
+    @_static_tool("short_name")
+    def get_short_name(iface):
         """Get the short name of the device.
         """
+        return iface.getShortName()
+
+    @mcp.tool()
+    @_static_tool()
+    def get_hardware(iface):
+        """Get the hardware model of the device.
+        """
+        # Index straight into nodesByNum instead of scanning every node for our own number
         try:
-            iface = iface_manager.get_interface()
-            if iface is None:
-                iface = iface_manager.set_interface("meshtastic.local", "tcp")
-            return iface.getShortName()
-        finally:
-            if iface:
-                iface.close()
+            return iface.nodesByNum[iface.myInfo.my_node_num]["user"]["hwModel"]
+        except KeyError:
+            return ""
 
     @mcp.tool()
-    async def get_my_node_info() -> str:
+    @_static_tool("my_node_info", as_json=True)
+    def get_my_node_info(iface):
         """Get the information about the current node connected to MCP
         """
-        try:
-            iface = iface_manager.get_interface()
-            if iface is None:
-                iface = iface_manager.set_interface("meshtastic.local", "tcp")
-            node_info = iface.getMyNodeInfo()
-            return json.dumps(node_info, indent=4)
-        finally:
-            if iface:
-                iface.close()
+        return iface.getMyNodeInfo()
     
     @mcp.tool()
-    async def get_my_user() -> str:
+    @_static_tool("my_user", as_json=True)
+    def get_my_user(iface):
         """Get the information about the current node's user connected to MCP
         """
-        try:
-            iface = iface_manager.get_interface()
-            if iface is None:
-                iface = iface_manager.set_interface("meshtastic.local", "tcp")
-            node_info = iface.getMyUser()
-            return json.dumps(node_info, indent=4)
-        finally:
-            if iface:
-                iface.close()
+        return iface.getMyUser()
 
     @mcp.tool()
-    async def get_public_key() -> str:
+    # The key only changes with the device, and a new interface misses the cache anyway
+    @_static_tool("public_key", as_json=True, ttl=math.inf)
+    def get_public_key(iface):
         """Get My Public Key for remote admin
         """
-        try:
-            iface = iface_manager.get_interface()
-            if iface is None:
-                iface = iface_manager.set_interface("meshtastic.local", "tcp")
-            key = iface.getPublicKey()
-            return json.dumps(key, indent=4)
-        finally:
-            if iface:
-                iface.close()
+        return iface.getPublicKey()
 
     @mcp.tool()
     async def send_alert(text: str, destinationId: int | str = BROADCAST_ADDR, channelIndex: int =0) -> str:
@@ -97,23 +324,18 @@ def register_mesh_tools(mcp, iface_manager: InterfaceManager) -> None:
             channelIndex (int, optional): The channel index. Defaults to 0.
         """
         try:
-            iface = iface_manager.get_interface()
-            if iface is None:
-                iface = iface_manager.set_interface("meshtastic.local", "tcp")
-            iface.sendAlert(text, destinationId, None, channelIndex)
-            return f"Alert sent: {text}"
+            iface = await _get_iface()
+            queue_send(functools.partial(iface.sendAlert, text, destinationId, None, channelIndex))
+            return f"Alert queued: {text}"
         except Exception as e:
             return f"Error sending alert: {str(e)}"
-        finally:
-            if iface:
-                iface.close()
     
     @mcp.tool()
-    async def send_data(data: str, destinationId: Union[int, str] = '^all', portNum: int = 256, wantAck: bool = False, wantResponse: bool = False, onResponseAckPermitted: bool = False, channelIndex: int = 0, hopLimit: Optional[int] = None, pkiEncrypted: bool = False, priority: int = 70) -> str:
+    async def send_data(data: Union[str, bytes], destinationId: Union[int, str] = '^all', portNum: int = 256, wantAck: bool = False, wantResponse: bool = False, onResponseAckPermitted: bool = False, channelIndex: int = 0, hopLimit: Optional[int] = None, pkiEncrypted: bool = False, priority: int = 70, b64: bool = False) -> str:
         """Send a data packet to some other node
 
         Args:
-            data (str): The data to send as a string (will be converted to bytes).
+            data (str | bytes): The data to send. Strings are UTF-8 encoded unless b64 is set, bytes are sent as-is.
             destinationId (int | str, optional): Where to send this message (default: BROADCAST_ADDR).
             portNum (int, optional): The application portnum of the destination.
             wantAck (bool, optional): True if you want delivery confirmation. Defaults to False.
@@ -123,16 +345,19 @@ def register_mesh_tools(mcp, iface_manager: InterfaceManager) -> None:
             hopLimit (int, optional): Hop limit to use. Defaults to None.
             pkiEncrypted (bool, optional): If True, data will be encrypted. Defaults to False.
             priority (int, optional): Message priority. Defaults to 70.
+            b64 (bool, optional): Treat a string data as base64 encoded binary. Defaults to False.
         """
         try:
-            iface = iface_manager.get_interface()
-            if iface is None:
-                iface = iface_manager.set_interface("meshtastic.local", "tcp")
-            
-            # Convert string to bytes
-            data_bytes = data.encode('utf-8') if isinstance(data, str) else data
+            # Convert string to bytes, binary payloads pass straight through
+            if isinstance(data, (bytes, bytearray, memoryview)):
+                data_bytes = bytes(data)
+            elif b64:
+                data_bytes = base64.b64decode(data, validate=True)
+            else:
+                data_bytes = data.encode('utf-8')
             
-            iface.sendData(
+            await _radio_call(
+                "sendData",
                 data_bytes,
                 destinationId,
                 portNum,
@@ -146,34 +371,26 @@ def register_mesh_tools(mcp, iface_manager: InterfaceManager) -> None:
                 None,  # No public key
                 priority
             )
-            return f"Data sent: {data[:20]}{'...' if len(data) > 20 else ''} to port {portNum}"
+            # Preview from the bytes already encoded instead of slicing the original again
+            preview = data_bytes[:20].decode('utf-8', errors='replace')
+            return f"Data sent: {preview}{'...' if len(data_bytes) > 20 else ''} to port {portNum}"
         except Exception as e:
             return f"Error sending data: {str(e)}"
-        finally:
-            if iface:
-                iface.close()
 
     @mcp.tool()
-    async def send_heartbeat() -> str:
+    @_iface_tool
+    async def send_heartbeat(iface) -> str:
         """Sends a heartbeat to the mesh.
         
         Returns:
             str: JSON status message
         """
-        try:
-            iface = iface_manager.get_interface()
-            if iface is None:
-                iface = iface_manager.set_interface("meshtastic.local", "tcp")
-            iface.sendHeartbeat()
-            return json.dumps({"status": "success", "message": "Heartbeat sent"}, indent=4)
-        except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=4)
-        finally:
-            if iface:
-                iface.close()
+        queue_send(iface.sendHeartbeat)
+        return _HEARTBEAT_QUEUED
     
     @mcp.tool()
-    async def show_nodes(includeSelf: bool = True, showFields: Optional[List[str]] = None) -> str:
+    @_iface_tool
+    async def show_nodes(iface, includeSelf: bool = True, showFields: Optional[List[str]] = None) -> str:
         """Gets information about all nodes in the mesh.
         
         Args:
@@ -183,18 +400,30 @@ def register_mesh_tools(mcp, iface_manager: InterfaceManager) -> None:
         Returns:
             str: Formatted node information
         """
-        try:
-            iface = iface_manager.get_interface()
-            if iface is None:
-                iface = iface_manager.set_interface("meshtastic.local", "tcp")
-            nodes_info = iface.showNodes(includeSelf, showFields)
+        # Only re-render the table when a packet or node update arrived or NODE_TABLE_TTL passed
+        key = (_nodes_version, includeSelf, tuple(showFields or ()))
+        nodes_info = _cache_get("show_nodes", iface, key)
+        if nodes_info is None:
             # The showNodes method returns a string, so we can just return it directly
-            return nodes_info
-        except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=4)
-        finally:
-            if iface:
-                iface.close()
+            nodes_info = _cache_put("show_nodes", iface, await asyncio.to_thread(iface.showNodes, includeSelf, showFields), key, NODE_TABLE_TTL)
+        return nodes_info
+
+    @mcp.tool()
+    @_iface_tool
+    async def show_nodes_ndjson(iface, includeSelf: bool = True, showFields: Optional[List[str]] = None) -> str:
+        """Gets all nodes in the mesh as newline-delimited JSON, one node per line.
+
+        The whole table is returned in one response; this is only an output format
+        for clients that want to parse nodes line by line.
+        
+        Args:
+            includeSelf (bool): Whether to include the local node in the output. Defaults to True.
+            showFields (Optional[List[str]]): Dotted field paths to keep, e.g. "user.longName". If None, all fields are shown.
+            
+        Returns:
+            str: One JSON object per line
+        """
+        return "".join(_node_lines(iface, includeSelf, showFields))
 
     # Fix send_waypoint to ensure consistent JSON return
     @mcp.tool()
@@ -202,7 +431,7 @@ def register_mesh_tools(mcp, iface_manager: InterfaceManager) -> None:
         lat: float,
         lon: float,
         name: str = "",
-        expire: str = "2025-10-01T00:00:00",
+        expire: Union[str, int] = "2025-10-01T00:00:00",
         description: str = "",
         id: int = 0,
     ) -> str:
@@ -212,7 +441,7 @@ def register_mesh_tools(mcp, iface_manager: InterfaceManager) -> None:
             lat (float): Latitude of the waypoint.
             lon (float): Longitude of the waypoint.
             name (str, optional): Name of the waypoint. Defaults to "".
-            expire (str, optional): Expiration date in ISO format. Defaults to "2025-10-01T00:00:00".
+            expire (str | int, optional): Expiration date in ISO format, UTC unless an offset is given, or epoch seconds. Defaults to "2025-10-01T00:00:00".
             description (str, optional): Description of the waypoint. Defaults to "".
             id (int, optional): ID of the waypoint. Defaults to 0.
             
@@ -220,29 +449,23 @@ def register_mesh_tools(mcp, iface_manager: InterfaceManager) -> None:
             str: JSON formatted response with status information
         """
         try:
-            iface = iface_manager.get_interface()
-            if iface is None:
-                iface = iface_manager.set_interface("meshtastic.local", "tcp")
-                
             # Assign a random hashed integer if id is 0
             if id == 0:
                 unique_string = f"{lat}{lon}{name}{description}{expire}"
                 id = int(hashlib.sha256(unique_string.encode()).hexdigest(), 16) % (10**8)  # Generate an 8-digit integer hash
 
-            result = iface.sendWaypoint(
+            await _radio_call(
+                "sendWaypoint",
                 waypoint_id=id,
                 name=name,
                 description=description,
-                expire=int(datetime.datetime.fromisoformat(expire).timestamp()),
+                expire=expire if isinstance(expire, int) else _iso_to_epoch(expire),
                 latitude=lat,
                 longitude=lon,
             )
-            return json.dumps({"status": "success", "message": f"Waypoint {id} created at lat: {lat}, lon: {lon}"}, indent=4)
+            return json_dumps({"status": "success", "message": f"Waypoint {id} created at lat: {lat}, lon: {lon}"})
         except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=4)
-        finally:
-            if iface:
-                iface.close()
+            return json_dumps({"status": "error", "message": str(e)})
 
     # Fix delete_waypoint to ensure consistent JSON return
     @mcp.tool()
@@ -260,16 +483,10 @@ def register_mesh_tools(mcp, iface_manager: InterfaceManager) -> None:
             str: JSON formatted response with status information
         """
         try:
-            iface = iface_manager.get_interface()
-            if iface is None:
-                iface = iface_manager.set_interface("meshtastic.local", "tcp")
-            result = iface.deleteWaypoint(id, destinationId, wantAck, wantResponse, channelIndex)
-            return json.dumps({"status": "success", "message": f"Waypoint {id} deleted"}, indent=4)
+            await _radio_call("deleteWaypoint", id, destinationId, wantAck, wantResponse, channelIndex)
+            return json_dumps({"status": "success", "message": f"Waypoint {id} deleted"})
         except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=4)
-        finally:
-            if iface:
-                iface.close()
+            return json_dumps({"status": "error", "message": str(e)})
 
     @mcp.tool()
     async def send_position(latitude: float = 0.0,
@@ -293,10 +510,8 @@ def register_mesh_tools(mcp, iface_manager: InterfaceManager) -> None:
         """
 
         try:
-            iface = iface_manager.get_interface()
-            if iface is None:
-                iface = iface_manager.set_interface("meshtastic.local", "tcp")
-            iface.sendPosition(
+            await _radio_call(
+                "sendPosition",
                 latitude,
                 longitude,
                 altitude,
@@ -308,9 +523,6 @@ def register_mesh_tools(mcp, iface_manager: InterfaceManager) -> None:
             return f"Position sent: {latitude}, {longitude}, {altitude}m"
         except Exception as e:
             return f"Error sending position: {str(e)}"
-        finally:
-            if iface:
-                iface.close()
     
     @mcp.tool()
     async def send_telemetry(destinationId: Union[int, str] = BROADCAST_ADDR,
@@ -326,16 +538,10 @@ def register_mesh_tools(mcp, iface_manager: InterfaceManager) -> None:
             telemetryType (str): Type of telemetry data to send. Defaults to "device_metrics".
         """
         try:
-            iface = iface_manager.get_interface()
-            if iface is None:
-                iface = iface_manager.set_interface("meshtastic.local", "tcp")
-            iface.sendTelemetry(destinationId, wantResponse, channelIndex, telemetryType)
+            await _radio_call("sendTelemetry", destinationId, wantResponse, channelIndex, telemetryType)
             return f"Telemetry sent: {telemetryType}"
         except Exception as e:
             return f"Error sending telemetry: {str(e)}"
-        finally:
-            if iface:
-                iface.close()
 
 
     @mcp.tool()
@@ -351,124 +557,97 @@ def register_mesh_tools(mcp, iface_manager: InterfaceManager) -> None:
             portNum (int, optional): Port number to use. Defaults to 1.
         """
         
-        # Maximum size of a Meshtastic text message in bytes
-        MAX_TEXT_SIZE = 192  # they told me 237 bytes but that appears to have been a lie
-        
         try:
-            iface = iface_manager.get_interface()
-            if iface is None:
-                iface = iface_manager.set_interface("meshtastic.local", "tcp")
             # Check if we need to chunk the message
-            if utf8len(text) <= MAX_TEXT_SIZE:
+            # Encode once, the size check and the chunker both work on these bytes
+            encoded = text.encode('utf-8')
+            if len(encoded) <= MAX_TEXT_SIZE:
                 # Message fits in one chunk
-                try:
-                    iface.sendText(text, destinationId, wantAck, wantResponse, None, channelIndex, portNum)
-                    return f"Message sent: {text}"
-                except Exception as e:
-                    return f"Error sending message: {str(e)}"
-                finally:
-                    iface.close()
-            else:
-                try:
-                    # We need to chunk the message
-                    chunks = []
-                    
-                    # First make a rough estimate of number of chunks needed
-                    text_length = utf8len(text)
-                    estimated_chunks = (text_length // MAX_TEXT_SIZE) + 1
-                    
-                    # Calculate the size of the counter prefix (e.g., "[1/10] ")
-                    # Add 4 for the brackets, slash, and space: "[" + "/" + "] "
-                    counter_size = 4 + len(str(estimated_chunks)) + len(str(estimated_chunks))
-                    
-                    # Calculate effective maximum content size per chunk
-                    effective_max_size = MAX_TEXT_SIZE - counter_size
-                    
-                    # Now chunk the message more accurately
-                    remaining_text = text
-                    
-                    while remaining_text:
-                        # Try to break at word boundary first
-                        current_chunk = ""
-                        current_size = 0
-                        
-                        # First try to find a word boundary
-                        test_chunk = remaining_text[:min(len(remaining_text), effective_max_size * 2)]  # Look ahead a bit
-                        
-                        # Start with the full allowed size and work backward to find a space
-                        bytes_so_far = 0
-                        last_space_idx = -1
-                        
-                        for i, char in enumerate(test_chunk):
-                            char_bytes = utf8len(char)
-                            if bytes_so_far + char_bytes > effective_max_size:
-                                # We've reached our limit
-                                break
-                            
-                            bytes_so_far += char_bytes
-                            if char.isspace():
-                                last_space_idx = i
-                        
-                        # If we found a space, break there
-                        if last_space_idx > 0:
-                            current_chunk = remaining_text[:last_space_idx + 1]
-                            remaining_text = remaining_text[last_space_idx + 1:]
-                        else:
-                            # No good word boundary found, fall back to character-by-character
-                            for char in remaining_text:
-                                char_size = utf8len(char)
-                                
-                                # Check if adding this character would exceed our effective limit
-                                if current_size + char_size > effective_max_size:
-                                    break
-                                
-                                current_chunk += char
-                                current_size += char_size
-                            
-                            # If we couldn't fit even one character, something is wrong
-                            if not current_chunk:
-                                return f"Error: Cannot chunk message - individual character exceeds maximum size"
-                            
-                            # Remove the processed part from remaining text
-                            remaining_text = remaining_text[len(current_chunk):]
-                        
-                        # Add this chunk to our list (without prefix for now)
-                        chunks.append(current_chunk)
-                    
-                    # Now that we know the exact number of chunks, add the prefixes
-                    total_chunks = len(chunks)
-                    final_chunks = []
-                    
-                    for i, chunk_content in enumerate(chunks):
-                        prefix = f"[{i+1}/{total_chunks}] "
-                        final_chunks.append(prefix + chunk_content)
-                    
-                    # Send all chunks with half-second delay between each
-                    results = []
-                    for i, chunk in enumerate(final_chunks):
-                        try:
-                            # Add a delay between chunks (except before the first one)
-                            if i > 0:
-                                await asyncio.sleep(0.5)  # Half-second delay
-                            
-                            iface.sendText(chunk, destinationId, wantAck, wantResponse, None, channelIndex, portNum)
-                            results.append(f"Sent chunk: {chunk}")
-                        except Exception as e:
-                            results.append(f"Error sending chunk: {str(e)}")
-                    
-                    return "\n".join(results)
-                except Exception as e:
-                    return f"Error chunking message: {str(e)}"
-                finally:
-                    iface.close()
+                await _radio_call("sendText", text, destinationId, wantAck, wantResponse, None, channelIndex, portNum)
+                return f"Message sent: {text}"
+            final_chunks = _chunk_text(encoded, MAX_TEXT_SIZE)
         except Exception as e:
             return f"Error sending text: {str(e)}"
-        finally:
-            if iface:
-                iface.close()
+        
+        # Send all chunks half a second apart, counting the time each send takes towards the gap
+        results = []
+        loop = asyncio.get_running_loop()
+        next_send = loop.time()
+        for chunk in final_chunks:
+            try:
+                delay = next_send - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                next_send = loop.time() + 0.5  # Half-second delay
+                
+                await _radio_call("sendText", chunk, destinationId, wantAck, wantResponse, None, channelIndex, portNum)
+                results.append(f"Sent chunk: {chunk}")
+            except Exception as e:
+                results.append(f"Error sending chunk: {str(e)}")
+        
+        return "\n".join(results)
+
+    @mcp.tool()
+    @_iface_tool
+    async def send_texts(iface, messages: List[dict]) -> str:
+        """Send several text messages in one call over the shared interface.
+        
+        Args:
+            messages (List[dict]): Messages to send in order. Each needs "text" and may set
+                "destinationId", "wantAck", "wantResponse", "channelIndex" and "portNum"
+                with the same defaults as send_text. Texts longer than one packet are not
+                chunked, use send_text for those.
+            
+        Returns:
+            str: JSON list with the status of each message
+        """
+        def send_all():
+            results = []
+            for message in messages:
+                text = message.get("text", "")
+                if utf8len(text) > MAX_TEXT_SIZE:
+                    results.append({"status": "error", "message": f"Text longer than {MAX_TEXT_SIZE} bytes, use send_text"})
+                    continue
+                try:
+                    packet = iface.sendText(
+                        text,
+                        message.get("destinationId", '^all'),
+                        message.get("wantAck", False),
+                        message.get("wantResponse", False),
+                        None,
+                        message.get("channelIndex", 0),
+                        message.get("portNum", 1),
+                    )
+                    results.append({"status": "success", "id": getattr(packet, "id", None)})
+                except Exception as e:
+                    results.append({"status": "error", "message": str(e)})
+            return results
+
+        # One hop off the event loop for the whole batch
+        return json_dumps(await asyncio.to_thread(send_all))
 
     @mcp.tool()
-    async def send_traceroute(dest: Union[int, str], hopLimit: int, channelIndex: int = 0) -> str:
+    @_iface_tool
+    async def recv_packets(iface, timeout: float = 0) -> str:
+        """Return packets received from the mesh since the last call.
+        
+        Args:
+            timeout (float, optional): Seconds to wait for a packet when none are buffered. Defaults to 0.
+            
+        Returns:
+            str: JSON list of received packets, binary payloads are base64 encoded
+        """
+        # iface is unused, requesting it makes sure a connection is up to receive packets
+        if not _received_packets and timeout > 0:
+            await _wait_for_packet(timeout)
+        packets = []
+        while _received_packets:
+            packets.append(_packet_for_json(_received_packets.popleft()))
+        return json_dumps(packets)
+
+    @mcp.tool()
+    @_iface_tool
+    async def send_traceroute(iface, dest: Union[int, str], hopLimit: int, channelIndex: int = 0) -> str:
         """Send a traceroute packet to the mesh.
         
         Args:
@@ -479,16 +658,12 @@ def register_mesh_tools(mcp, iface_manager: InterfaceManager) -> None:
         Returns:
             str: Status message indicating success or error
         """
-        try:
-            iface = iface_manager.get_interface()
-            if iface is None:
-                iface = iface_manager.set_interface("meshtastic.local", "tcp")
-            iface.sendTraceRoute(dest, hopLimit, channelIndex)
-            return json.dumps({"status": "success", "message": f"Traceroute sent to {dest}"}, indent=4)
-        except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=4)
-        finally:
-            if iface:
-                iface.close()
+        # sendTraceRoute waits for the route reply, so run it on its own worker instead of
+        # the send queue where it would hold up heartbeats and alerts behind it
+        result = await asyncio.to_thread(iface.sendTraceRoute, dest, hopLimit, channelIndex)
+        response = {"status": "success", "message": f"Traceroute sent to {dest}"}
+        if result is not None:
+            response["result"] = result
+        return json_dumps(response)
     
     return mcp
\ No newline at end of file
@@ -1,11 +1,13 @@
-import json
 import sys
 import os
 import asyncio
-from typing import Optional
+import logging
+import time
+from typing import Any, Optional
 import meshtastic
 from meshtastic.node import Node
-from meshtastic.util import MessageToJson
+from google.protobuf.json_format import MessageToDict
+from meshtastic.protobuf.channel_pb2 import Channel
 from meshtastic.protobuf.config_pb2 import Config
 
 # Add the parent directory to the Python path for local imports
@@ -14,38 +16,76 @@ if __name__ == "__main__" and __package__ is None:
     sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from MCPtastic.interface_manager import InterfaceManager
+from MCPtastic.utils import json_dumps
+
+logger = logging.getLogger(__name__)
+
+# Default for getattr probes where None is a meaningful attribute value
+_MISSING = object()
+
+# Properties show_info reports for remote nodes that expose no config
+_BASIC_NODE_ATTRS = ('nodeId', 'longName', 'shortName', 'hwModel', 'isRouter', 'isMqttEnabled')
+
+# Enum number -> name tables, built once instead of walking the descriptor per value
+_CHANNEL_ROLE_NAMES = {v.number: v.name for v in Channel.Role.DESCRIPTOR.values}
+_DEVICE_ROLE_NAMES = {v.number: v.name for v in Config.DeviceConfig.Role.DESCRIPTOR.values}
+
+# Seconds a node lookup is reused, so a burst of tool calls shares one lookup
+NODE_CACHE_TTL = 1.0
+# Remote nodeId -> (expiry, interface, node); the interface guards against reconnects
+_node_cache: dict[str, tuple[float, object, Node]] = {}
 
 
 # Helper function to get node object
-async def _get_node_object(iface_manager: InterfaceManager, nodeId: str) -> Optional[Node]:
-    """Helper function to get the node object, either local or remote."""
+async def _get_node_object(iface_manager: InterfaceManager, nodeId: str) -> tuple[Any, Optional[Node]]:
+    """Helper function to get the interface and the node object, either local or remote."""
     iface = iface_manager.get_interface()
     if not iface:
         # Attempt to set a default interface if none is active
         # This might need adjustment based on how MCPtastic handles default interfaces
-        print("No active interface. Attempting to connect to default TCP interface.")
+        logger.info("No active interface. Attempting to connect to default TCP interface.")
         try:
-            iface = await asyncio.to_thread(iface_manager.set_interface, "meshtastic.local", "tcp")
+            iface = await asyncio.to_thread(iface_manager.connect_default)
             if not iface:
                 raise Exception("Failed to connect to a Meshtastic interface.")
+        except TimeoutError:
+            # Keep the ConnectTimeout message as is
+            raise
         except Exception as e:
             raise Exception(f"Failed to connect to a Meshtastic interface: {str(e)}")
 
     if nodeId == "local":
-        return iface.localNode
-    else:
-        # For remote nodes, check if nodes attribute exists and has the requested node
-        if hasattr(iface, 'nodes') and iface.nodes:
-            return iface.nodes.get(nodeId)
-        # Try alternative properties on different meshtastic library versions
-        if hasattr(iface, 'nodesByNum') and iface.nodesByNum:
-            return iface.nodesByNum.get(nodeId)
-        if hasattr(iface, 'getNode'):
-            try:
-                return iface.getNode(nodeId)
-            except Exception:
-                pass
-        return None
+        # Common case: the local node is a plain attribute, it is never looked up or cached
+        return iface, iface.localNode
+    cached = _node_cache.get(nodeId)
+    if cached is not None and cached[1] is iface and cached[0] > time.monotonic():
+        return iface, cached[2]
+    node = _find_node(iface, nodeId)
+    if node is not None:
+        _node_cache[nodeId] = (time.monotonic() + NODE_CACHE_TTL, iface, node)
+    return iface, node
+
+
+def _forget_node(nodeId: str) -> None:
+    """Drops a cached remote node lookup after a tool changes or restarts that node."""
+    _node_cache.pop(nodeId, None)
+
+
+def _find_node(iface, nodeId: str) -> Optional[Node]:
+    """Looks up a remote node on the interface."""
+    # Check if nodes attribute exists and has the requested node
+    if nodes := getattr(iface, 'nodes', None):
+        return nodes.get(nodeId)
+    # Try alternative properties on different meshtastic library versions
+    if nodes_by_num := getattr(iface, 'nodesByNum', None):
+        return nodes_by_num.get(nodeId)
+    get_node = getattr(iface, 'getNode', None)
+    if get_node is not None:
+        try:
+            return get_node(nodeId)
+        except Exception:
+            pass
+    return None
 
 
 def register_node_tools(mcp, iface_manager: InterfaceManager) -> None:
@@ -62,48 +102,42 @@ def register_node_tools(mcp, iface_manager: InterfaceManager) -> None:
             str: JSON string containing channel information or an error message.
         """
         try:
-            node = await _get_node_object(iface_manager, nodeId)
+            _, node = await _get_node_object(iface_manager, nodeId)
             if not node:
-                return json.dumps({"status": "error", "message": f"Node {nodeId} not found or interface not available."})
+                return json_dumps({"status": "error", "message": f"Node {nodeId} not found or interface not available."})
 
+            # Each attribute is looked up once with getattr instead of a hasattr probe plus a read
             channels_info = []
-            if hasattr(node, 'channels') and node.channels: # localNode stores channels in .channels
-                for ch_settings in node.channels:
-                    channels_info.append(MessageToJson(ch_settings))
-            elif hasattr(node, 'settings') and hasattr(node.settings, 'channel_settings') and node.settings.channel_settings: # remote nodes store in .settings.channel_settings
-                for ch_settings in node.settings.channel_settings:
-                    channels_info.append(MessageToJson(ch_settings))
-            elif hasattr(node, 'localConfig') and hasattr(node.localConfig, 'channel_settings') and node.localConfig.channel_settings: # some local node versions
-                for ch_settings in node.localConfig.channel_settings:
-                    channels_info.append(MessageToJson(ch_settings))
+            if channels := getattr(node, 'channels', None): # localNode stores channels in .channels
+                for ch_settings in channels:
+                    channels_info.append(MessageToDict(ch_settings))
+            elif channel_settings := getattr(getattr(node, 'settings', None), 'channel_settings', None): # remote nodes store in .settings.channel_settings
+                for ch_settings in channel_settings:
+                    channels_info.append(MessageToDict(ch_settings))
+            elif channel_settings := getattr(getattr(node, 'localConfig', None), 'channel_settings', None): # some local node versions
+                for ch_settings in channel_settings:
+                    channels_info.append(MessageToDict(ch_settings))
             else: # Try remote call if local attributes are not found or empty
-                if hasattr(node, 'showChannels'):
-                    remote_channels = await asyncio.to_thread(node.showChannels)
+                show_remote_channels = getattr(node, 'showChannels', None)
+                if show_remote_channels is not None:
+                    remote_channels = await asyncio.to_thread(show_remote_channels)
                     if remote_channels: # showChannels already returns a dict/list of dicts
-                        return json.dumps({"status": "success", "nodeId": nodeId, "channels": remote_channels}, indent=4)
+                        return json_dumps({"status": "success", "nodeId": nodeId, "channels": remote_channels})
                     else:
-                        return json.dumps({"status": "error", "nodeId": nodeId, "message": "No channel data found for node or method not directly available for remote nodes in this manner."})
+                        return json_dumps({"status": "error", "nodeId": nodeId, "message": "No channel data found for node or method not directly available for remote nodes in this manner."})
                 else:
-                    return json.dumps({"status": "error", "nodeId": nodeId, "message": "No channel data found for node and no showChannels method available."})
+                    return json_dumps({"status": "error", "nodeId": nodeId, "message": "No channel data found for node and no showChannels method available."})
             
-            return json.dumps({"status": "success", "nodeId": nodeId, "channels": channels_info}, indent=4)
+            return json_dumps({"status": "success", "nodeId": nodeId, "channels": channels_info})
         except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=4)
+            return json_dumps({"status": "error", "message": str(e)})
 
-    @mcp.tool()
-    async def show_info(nodeId: str = "local") -> str:
-        """Retrieves and displays preferences, module preferences, and channel information for the specified node.
-
-        Args:
-            nodeId (str): The node ID (e.g., '!b827ebe5a670') or 'local' for the local node. Defaults to "local".
-
-        Returns:
-            str: JSON string containing node information or an error message.
-        """
+    async def _node_info(nodeId: str) -> dict:
+        """Collects the show_info response for one node as a dict."""
         try:
-            node = await _get_node_object(iface_manager, nodeId)
+            iface, node = await _get_node_object(iface_manager, nodeId)
             if not node:
-                return json.dumps({"status": "error", "message": f"Node {nodeId} not found or interface not available."})
+                return {"status": "error", "message": f"Node {nodeId} not found or interface not available."}
 
             # The showInfo method in meshtastic-python typically prints to console.
             # We want to capture this data. It often returns a dictionary or can be made to.
@@ -112,43 +146,43 @@ def register_node_tools(mcp, iface_manager: InterfaceManager) -> None:
             
             info_data = {}
             if nodeId == "local":
-                iface = iface_manager.get_interface()
                 # For local node, gather info from various properties
-                if hasattr(iface, 'myInfo'):
-                    info_data["myNodeInfo"] = iface.myInfo
-                if hasattr(iface, 'localNode') and hasattr(iface.localNode, 'localConfig'):
-                    info_data["localConfig"] = MessageToJson(iface.localNode.localConfig)
-                if hasattr(iface, 'localNode') and hasattr(iface.localNode, 'moduleConfig'):
-                    info_data["moduleConfig"] = MessageToJson(iface.localNode.moduleConfig)
-                if hasattr(iface, 'localNode') and hasattr(iface.localNode, 'channels'):
-                    info_data["channels"] = [MessageToJson(ch) for ch in iface.localNode.channels]
+                my_info = getattr(iface, 'myInfo', _MISSING)
+                if my_info is not _MISSING:
+                    info_data["myNodeInfo"] = MessageToDict(my_info) if my_info is not None else None
+                local_node = getattr(iface, 'localNode', None)
+                local_config = getattr(local_node, 'localConfig', _MISSING)
+                if local_config is not _MISSING:
+                    info_data["localConfig"] = MessageToDict(local_config)
+                module_config = getattr(local_node, 'moduleConfig', _MISSING)
+                if module_config is not _MISSING:
+                    info_data["moduleConfig"] = MessageToDict(module_config)
+                local_channels = getattr(local_node, 'channels', _MISSING)
+                if local_channels is not _MISSING:
+                    info_data["channels"] = [MessageToDict(ch) for ch in local_channels]
             else:
                 # For remote nodes, get available properties
-                if hasattr(node, 'localConfig') and node.localConfig:
-                    info_data["localConfig"] = MessageToJson(node.localConfig)
-                if hasattr(node, 'moduleConfig') and node.moduleConfig:
-                    info_data["moduleConfig"] = MessageToJson(node.moduleConfig)
-                if hasattr(node, 'role') and node.role: #This is not standard, but some custom versions might have it
-                    info_data["role"] = Config.DeviceConfig.Role.Name(node.role)
+                if local_config := getattr(node, 'localConfig', None):
+                    info_data["localConfig"] = MessageToDict(local_config)
+                if module_config := getattr(node, 'moduleConfig', None):
+                    info_data["moduleConfig"] = MessageToDict(module_config)
+                if role := getattr(node, 'role', None): #This is not standard, but some custom versions might have it
+                    info_data["role"] = _DEVICE_ROLE_NAMES.get(role, role)
 
                 # Fallback: try to get common useful info
                 if not info_data or len(info_data) == 0:
-                    # Add basic node properties safely
-                    for attr in ['nodeId', 'longName', 'shortName', 'hwModel']:
-                        if hasattr(node, attr):
-                            info_data[attr] = getattr(node, attr)
-                    
-                    # Boolean properties
-                    for bool_attr in ['isRouter', 'isMqttEnabled']:
-                        if hasattr(node, bool_attr):
-                            info_data[bool_attr] = getattr(node, bool_attr)
+                    # Add basic and boolean node properties safely
+                    for attr in _BASIC_NODE_ATTRS:
+                        value = getattr(node, attr, _MISSING)
+                        if value is not _MISSING:
+                            info_data[attr] = value
                     
                     # Handle channels if available
-                    if hasattr(node, 'channels') and node.channels:
-                        channels_info = [MessageToJson(ch) for ch in node.channels]
+                    if channels := getattr(node, 'channels', None):
+                        channels_info = [MessageToDict(ch) for ch in channels]
                         info_data["channels"] = channels_info
-                    elif hasattr(node, 'settings') and hasattr(node.settings, 'channel_settings'):
-                        channels_info = [MessageToJson(ch) for ch in node.settings.channel_settings]
+                    elif (channel_settings := getattr(getattr(node, 'settings', None), 'channel_settings', _MISSING)) is not _MISSING:
+                        channels_info = [MessageToDict(ch) for ch in channel_settings]
                         info_data["channels"] = channels_info
 
             if not info_data or len(info_data) == 0:
@@ -159,17 +193,42 @@ def register_node_tools(mcp, iface_manager: InterfaceManager) -> None:
                     "shortName": getattr(node, 'shortName', 'unknown'),
                     "hwModel": getattr(node, 'hwModel', 'unknown')
                 }
-                return json.dumps({
+                return {
                     "status": "success", 
                     "nodeId": nodeId, 
                     "message": "Basic info retrieved. For full remote node details, specific config requests might be needed.", 
                     "data": basic_info
-                }, indent=4)
+                }
 
-            return json.dumps({"status": "success", "nodeId": nodeId, "info": info_data}, indent=4)
+            return {"status": "success", "nodeId": nodeId, "info": info_data}
 
         except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=4)
+            return {"status": "error", "message": str(e)}
+
+    @mcp.tool()
+    async def show_info(nodeId: str = "local") -> str:
+        """Retrieves and displays preferences, module preferences, and channel information for the specified node.
+
+        Args:
+            nodeId (str): The node ID (e.g., '!b827ebe5a670') or 'local' for the local node. Defaults to "local".
+
+        Returns:
+            str: JSON string containing node information or an error message.
+        """
+        return json_dumps(await _node_info(nodeId))
+
+    @mcp.tool()
+    async def show_info_many(nodeIds: list[str]) -> str:
+        """Retrieves the show_info data for several nodes in one call.
+
+        Args:
+            nodeIds (list[str]): The node IDs to query; 'local' is accepted too.
+
+        Returns:
+            str: JSON string mapping each node ID to its show_info result.
+        """
+        results = await asyncio.gather(*(_node_info(nodeId) for nodeId in nodeIds))
+        return json_dumps({"status": "success", "nodes": dict(zip(nodeIds, results))})
 
     @mcp.tool()
     async def set_owner(long_name: Optional[str] = None, short_name: Optional[str] = None, is_licensed: bool = False, nodeId: str = "local") -> str:
@@ -185,25 +244,21 @@ def register_node_tools(mcp, iface_manager: InterfaceManager) -> None:
             str: JSON string with operation status.
         """
         try:
-            node = await _get_node_object(iface_manager, nodeId)
+            iface, node = await _get_node_object(iface_manager, nodeId)
             if not node:
-                return json.dumps({"status": "error", "message": f"Node {nodeId} not found."})
-
-            iface = iface_manager.get_interface()
-            if not iface:
-                return json.dumps({"status": "error", "message": "Interface not available."})
+                return json_dumps({"status": "error", "message": f"Node {nodeId} not found."})
             
             current_long_name = None
             current_short_name = None
 
             if nodeId == "local":
-                if hasattr(iface, 'getLongName'):
-                    current_long_name = iface.getLongName()
-                if hasattr(iface, 'getShortName'):
-                    current_short_name = iface.getShortName()
-            elif hasattr(node, 'user') and node.user:
-                current_long_name = getattr(node.user, 'long_name', None)
-                current_short_name = getattr(node.user, 'short_name', None)
+                if (get_long_name := getattr(iface, 'getLongName', None)) is not None:
+                    current_long_name = get_long_name()
+                if (get_short_name := getattr(iface, 'getShortName', None)) is not None:
+                    current_short_name = get_short_name()
+            elif user := getattr(node, 'user', None):
+                current_long_name = getattr(user, 'long_name', None)
+                current_short_name = getattr(user, 'short_name', None)
             
             # Use current names if new names are not provided
             final_long_name = long_name if long_name is not None else current_long_name
@@ -216,19 +271,23 @@ def register_node_tools(mcp, iface_manager: InterfaceManager) -> None:
                 final_short_name = "Mesh"    # Default if not set
 
             if nodeId == "local":
-                if hasattr(iface, 'setOwner'):
-                    await asyncio.to_thread(iface.setOwner, final_long_name, final_short_name, is_licensed)
+                if (set_owner_fn := getattr(iface, 'setOwner', None)) is not None:
+                    await asyncio.to_thread(set_owner_fn, final_long_name, final_short_name, is_licensed)
+                    iface_manager.invalidate_static_info()
                 else:
-                    return json.dumps({"status": "error", "message": "Interface does not have setOwner method."})
+                    return json_dumps({"status": "error", "message": "Interface does not have setOwner method."})
             else:
-                if hasattr(node, 'setOwner'):
-                    await asyncio.to_thread(node.setOwner, final_long_name, final_short_name, is_licensed)
+                if (set_owner_fn := getattr(node, 'setOwner', None)) is not None:
+                    await asyncio.to_thread(set_owner_fn, final_long_name, final_short_name, is_licensed)
+                    _forget_node(nodeId)
+                    # The cached node table shows the old names
+                    iface_manager.invalidate_static_info()
                 else:
-                    return json.dumps({"status": "error", "message": "Node does not have setOwner method."})
+                    return json_dumps({"status": "error", "message": "Node does not have setOwner method."})
             
-            return json.dumps({"status": "success", "nodeId": nodeId, "message": f"Owner set to Long: {final_long_name}, Short: {final_short_name}, Licensed: {is_licensed}"}, indent=4)
+            return json_dumps({"status": "success", "nodeId": nodeId, "message": f"Owner set to Long: {final_long_name}, Short: {final_short_name}, Licensed: {is_licensed}"})
         except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=4)
+            return json_dumps({"status": "error", "message": str(e)})
 
     @mcp.tool()
     async def get_url(nodeId: str = "local", includeAll: bool = True) -> str:
@@ -242,49 +301,44 @@ def register_node_tools(mcp, iface_manager: InterfaceManager) -> None:
             str: JSON string with the URL(s) or an error message.
         """
         try:
-            node = await _get_node_object(iface_manager, nodeId)
+            iface, node = await _get_node_object(iface_manager, nodeId)
             if not node:
-                return json.dumps({"status": "error", "message": f"Node {nodeId} not found."})
-
-            iface = iface_manager.get_interface()
-            if not iface:
-                return json.dumps({"status": "error", "message": "Interface not available."})
+                return json_dumps({"status": "error", "message": f"Node {nodeId} not found."})
 
             if nodeId == "local":
                 if includeAll:
-                    if hasattr(iface, 'getQRCodeURL'):
-                        url = await asyncio.to_thread(iface.getQRCodeURL)
-                        return json.dumps({"status": "success", "nodeId": "local", "type": "all_channels_qr_code_url", "url": url}, indent=4)
+                    if (get_qr_code_url := getattr(iface, 'getQRCodeURL', None)) is not None:
+                        url = await asyncio.to_thread(get_qr_code_url)
+                        return json_dumps({"status": "success", "nodeId": "local", "type": "all_channels_qr_code_url", "url": url})
                     else:
-                        return json.dumps({"status": "error", "message": "Interface does not have getQRCodeURL method."})
+                        return json_dumps({"status": "error", "message": "Interface does not have getQRCodeURL method."})
                 else:
-                    if hasattr(iface, 'getURL'):
-                        url = await asyncio.to_thread(iface.getURL, 0)  # Assuming primary channel is index 0
-                        return json.dumps({"status": "success", "nodeId": "local", "type": "primary_channel_url", "url": url}, indent=4)
+                    if (get_url_fn := getattr(iface, 'getURL', None)) is not None:
+                        url = await asyncio.to_thread(get_url_fn, 0)  # Assuming primary channel is index 0
+                        return json_dumps({"status": "success", "nodeId": "local", "type": "primary_channel_url", "url": url})
                     else:
-                        return json.dumps({"status": "error", "message": "Interface does not have getURL method."})
+                        return json_dumps({"status": "error", "message": "Interface does not have getURL method."})
             else:
                 # For remote nodes, collect and return channel settings
                 channels_data = []
-                if hasattr(node, 'settings') and hasattr(node.settings, 'channel_settings'):
-                    for i, ch_setting in enumerate(node.settings.channel_settings):
+                channel_settings = getattr(getattr(node, 'settings', None), 'channel_settings', None)
+                if channel_settings is not None:
+                    for i, ch_setting in enumerate(channel_settings):
                         ch_info = {
                             "index": i,
                             "name": getattr(ch_setting, 'name', 'unknown'),
-                            "role": Config.ChannelConfig.Role.Name(ch_setting.role) 
-                                if hasattr(ch_setting, "role") and hasattr(Config.ChannelConfig.Role, 'Name') 
-                                else "PRIMARY",
+                            "role": _CHANNEL_ROLE_NAMES.get(getattr(ch_setting, 'role', None), "PRIMARY"),
                             "psk_hint": "PSK required to form URL, not shown for security."
                         }
                         channels_data.append(ch_info)
 
                 if channels_data:
-                    return json.dumps({"status": "success", "nodeId": nodeId, "message": "Channel data for URL construction. Manual URL creation may be needed for remote nodes.", "channels": channels_data}, indent=4)
+                    return json_dumps({"status": "success", "nodeId": nodeId, "message": "Channel data for URL construction. Manual URL creation may be needed for remote nodes.", "channels": channels_data})
                 else:
-                    return json.dumps({"status": "info", "nodeId": nodeId, "message": "Cannot directly get URL for remote node without channel data. Try 'show_channels' first."}, indent=4)
+                    return json_dumps({"status": "info", "nodeId": nodeId, "message": "Cannot directly get URL for remote node without channel data. Try 'show_channels' first."})
 
         except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=4)
+            return json_dumps({"status": "error", "message": str(e)})
 
     @mcp.tool()
     async def set_url(url: str, addOnly: bool = False, nodeId: str = "local") -> str:
@@ -302,23 +356,24 @@ def register_node_tools(mcp, iface_manager: InterfaceManager) -> None:
         """
         try:
             if nodeId != "local":
-                return json.dumps({"status": "error", "message": f"setURL for remote node '{nodeId}' is not directly supported by this tool yet. Use on local node."})
+                return json_dumps({"status": "error", "message": f"setURL for remote node '{nodeId}' is not directly supported by this tool yet. Use on local node."})
 
             iface = iface_manager.get_interface()
             if not iface:
-                return json.dumps({"status": "error", "message": "Interface not available."})
+                return json_dumps({"status": "error", "message": "Interface not available."})
             
             if addOnly:
-                print(f"Note: 'addOnly' parameter for setURL is not a standard feature of meshtastic.py; URL will likely set the primary channel or be handled as per library default.")
+                logger.info("Note: 'addOnly' parameter for setURL is not a standard feature of meshtastic.py; URL will likely set the primary channel or be handled as per library default.")
 
-            if hasattr(iface, 'setURL'):
-                await asyncio.to_thread(iface.setURL, url)
-                return json.dumps({"status": "success", "nodeId": "local", "message": f"URL set. Node will apply changes. Current primary channel may have been updated or new channels added based on URL type."}, indent=4)
+            if (set_url_fn := getattr(iface, 'setURL', None)) is not None:
+                await asyncio.to_thread(set_url_fn, url)
+                iface_manager.invalidate_static_info()
+                return json_dumps({"status": "success", "nodeId": "local", "message": f"URL set. Node will apply changes. Current primary channel may have been updated or new channels added based on URL type."})
             else:
-                return json.dumps({"status": "error", "message": "Interface does not have setURL method."})
+                return json_dumps({"status": "error", "message": "Interface does not have setURL method."})
         
         except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=4)
+            return json_dumps({"status": "error", "message": str(e)})
 
     @mcp.tool()
     async def reboot(secs: int = 10, nodeId: str = "local") -> str:
@@ -332,26 +387,26 @@ def register_node_tools(mcp, iface_manager: InterfaceManager) -> None:
             str: JSON string with operation status.
         """
         try:
-            node = await _get_node_object(iface_manager, nodeId)
+            iface, node = await _get_node_object(iface_manager, nodeId)
             if not node:
-                return json.dumps({"status": "error", "message": f"Node {nodeId} not found."})
+                return json_dumps({"status": "error", "message": f"Node {nodeId} not found."})
 
-            if hasattr(node, 'reboot'):
-                await asyncio.to_thread(node.reboot, secs)
-                return json.dumps({"status": "success", "nodeId": nodeId, "message": f"Node will reboot in {secs} seconds."}, indent=4)
+            if (action := getattr(node, 'reboot', None)) is not None:
+                await asyncio.to_thread(action, secs)
+                _forget_node(nodeId)
+                return json_dumps({"status": "success", "nodeId": nodeId, "message": f"Node will reboot in {secs} seconds."})
             else:
                 # Try via interface if node doesn't have reboot method
-                iface = iface_manager.get_interface()
-                if nodeId == "local" and hasattr(iface, 'getNode'):
-                    node_via_iface = iface.getNode(nodeId)
-                    if hasattr(node_via_iface, 'reboot'):
-                        await asyncio.to_thread(node_via_iface.reboot, secs)
-                        return json.dumps({"status": "success", "nodeId": nodeId, "message": f"Node will reboot in {secs} seconds via interface call."})
+                if nodeId == "local" and (get_node := getattr(iface, 'getNode', None)) is not None:
+                    node_via_iface = get_node(nodeId)
+                    if (action := getattr(node_via_iface, 'reboot', None)) is not None:
+                        await asyncio.to_thread(action, secs)
+                        return json_dumps({"status": "success", "nodeId": nodeId, "message": f"Node will reboot in {secs} seconds via interface call."})
                 
-                return json.dumps({"status": "error", "message": f"Node object for {nodeId} does not have a 'reboot' method."})
+                return json_dumps({"status": "error", "message": f"Node object for {nodeId} does not have a 'reboot' method."})
         
         except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=4)
+            return json_dumps({"status": "error", "message": str(e)})
 
     @mcp.tool()
     async def shutdown(secs: int = 10, nodeId: str = "local") -> str:
@@ -365,27 +420,27 @@ def register_node_tools(mcp, iface_manager: InterfaceManager) -> None:
             str: JSON string with operation status.
         """
         try:
-            node = await _get_node_object(iface_manager, nodeId)
+            iface, node = await _get_node_object(iface_manager, nodeId)
             if not node:
-                return json.dumps({"status": "error", "message": f"Node {nodeId} not found."})
+                return json_dumps({"status": "error", "message": f"Node {nodeId} not found."})
 
             # Check if the node object has the shutdown method
-            if hasattr(node, "shutdown"):
-                await asyncio.to_thread(node.shutdown, secs)
-                return json.dumps({"status": "success", "nodeId": nodeId, "message": f"Node will shutdown in {secs} seconds."}, indent=4)
+            if (action := getattr(node, "shutdown", None)) is not None:
+                await asyncio.to_thread(action, secs)
+                _forget_node(nodeId)
+                return json_dumps({"status": "success", "nodeId": nodeId, "message": f"Node will shutdown in {secs} seconds."})
             else:
                 # Try via interface if node doesn't have shutdown method
-                iface = iface_manager.get_interface()
-                if nodeId == "local" and hasattr(iface, 'getNode'):
-                    node_via_iface = iface.getNode(nodeId) 
-                    if hasattr(node_via_iface, 'shutdown'):
-                        await asyncio.to_thread(node_via_iface.shutdown, secs)
-                        return json.dumps({"status": "success", "nodeId": nodeId, "message": f"Node will shutdown in {secs} seconds via interface call."})
+                if nodeId == "local" and (get_node := getattr(iface, 'getNode', None)) is not None:
+                    node_via_iface = get_node(nodeId)
+                    if (action := getattr(node_via_iface, 'shutdown', None)) is not None:
+                        await asyncio.to_thread(action, secs)
+                        return json_dumps({"status": "success", "nodeId": nodeId, "message": f"Node will shutdown in {secs} seconds via interface call."})
                 
-                return json.dumps({"status": "error", "message": f"Node object for {nodeId} does not have a 'shutdown' method."})
+                return json_dumps({"status": "error", "message": f"Node object for {nodeId} does not have a 'shutdown' method."})
         
         except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=4)
+            return json_dumps({"status": "error", "message": str(e)})
 
     @mcp.tool()
     async def factory_reset(nodeId: str = "local", full: bool = False) -> str:
@@ -400,28 +455,28 @@ def register_node_tools(mcp, iface_manager: InterfaceManager) -> None:
             str: JSON string with operation status.
         """
         try:
-            node = await _get_node_object(iface_manager, nodeId)
+            iface, node = await _get_node_object(iface_manager, nodeId)
             if not node:
-                return json.dumps({"status": "error", "message": f"Node {nodeId} not found."})
+                return json_dumps({"status": "error", "message": f"Node {nodeId} not found."})
 
             if full:
-                print(f"Note: 'full=True' for factory_reset is a conceptual parameter. The node will perform its standard factory reset procedure.")
+                logger.info("Note: 'full=True' for factory_reset is a conceptual parameter. The node will perform its standard factory reset procedure.")
 
-            if hasattr(node, 'factoryReset'):
-                await asyncio.to_thread(node.factoryReset)
-                return json.dumps({"status": "success", "nodeId": nodeId, "message": "Node will perform a factory reset. It will likely reboot and lose current settings."}, indent=4)
+            if (action := getattr(node, 'factoryReset', None)) is not None:
+                await asyncio.to_thread(action)
+                _forget_node(nodeId)
+                return json_dumps({"status": "success", "nodeId": nodeId, "message": "Node will perform a factory reset. It will likely reboot and lose current settings."})
             else:
                 # Try via interface if node doesn't have factoryReset method
-                iface = iface_manager.get_interface()
-                if nodeId == "local" and hasattr(iface, 'getNode'):
-                    node_via_iface = iface.getNode(nodeId)
-                    if hasattr(node_via_iface, 'factoryReset'):
-                        await asyncio.to_thread(node_via_iface.factoryReset)
-                        return json.dumps({"status": "success", "nodeId": nodeId, "message": "Node will perform factory reset via interface call."})
+                if nodeId == "local" and (get_node := getattr(iface, 'getNode', None)) is not None:
+                    node_via_iface = get_node(nodeId)
+                    if (action := getattr(node_via_iface, 'factoryReset', None)) is not None:
+                        await asyncio.to_thread(action)
+                        return json_dumps({"status": "success", "nodeId": nodeId, "message": "Node will perform factory reset via interface call."})
                 
-                return json.dumps({"status": "error", "message": f"Node object for {nodeId} does not have a 'factoryReset' method."})
+                return json_dumps({"status": "error", "message": f"Node object for {nodeId} does not have a 'factoryReset' method."})
         
         except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=4)
+            return json_dumps({"status": "error", "message": str(e)})
     
     return mcp  # Return mcp to chain registrations if needed
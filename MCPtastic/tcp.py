@@ -1,17 +1,21 @@
 # Messaging and communication tools
+import asyncio
 import meshtastic
 
 def register_tcp(mcp, interface_manager):
     """Register the TCP functionality"""
     
     @mcp.tool()
-    async def tcp_connect(address: str, debugOut=None, noProto: bool = False, connectNow: bool = True, portNumber: int = 4403, noNodes: bool = False) -> str:
+    async def tcp_connect(address: str, debugOut=None, noProto: bool = False, connectNow: bool = True, portNumber: int = 4403, noNodes: bool = False, timeout: int = 30) -> str:
         """connect to a TCP device
+        
+        Args:
+            timeout (int): Seconds to wait for the radio before failing. Defaults to 30.
         """
         out = "connecting to tcp device...\n"
         try:
             # Use the shared interface management module for consistent caching and connection handling
-            iface = interface_manager.set_interface(address, "tcp", debugOut, noProto, connectNow, portNumber, noNodes)
+            iface = await asyncio.to_thread(interface_manager.set_interface, address, "tcp", debugOut, noProto, connectNow, portNumber, noNodes, timeout=timeout)
             out += f"Connected to {address}\n"
                 
         except Exception as e:
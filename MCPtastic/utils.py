@@ -1,9 +1,64 @@
 # Utility functions used by multiple modules
+import asyncio
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Optional
 import httpx
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib encoder
+    orjson = None
+
+# Threads for blocking radio calls. The radio handles one request at a time,
+# so a small fixed pool is plenty and keeps them off unrelated stdlib work.
+MESH_WORKERS = 8
+mesh_executor = ThreadPoolExecutor(max_workers=MESH_WORKERS, thread_name_prefix="mcptastic-mesh")
+
+@asynccontextmanager
+async def use_mesh_executor(server):
+    """FastMCP lifespan that runs every asyncio.to_thread call on mesh_executor."""
+    asyncio.get_running_loop().set_default_executor(mesh_executor)
+    yield
+
+# Tool responses are compact JSON unless MCPTASTIC_PRETTY is set for human debugging
+PRETTY_JSON = os.environ.get("MCPTASTIC_PRETTY", "") not in ("", "0")
+
 def utf8len(s):
     return len(s.encode('utf-8'))
 
+def json_dumps(obj, indent: Optional[bool] = None) -> str:
+    """Serialize an object to a JSON string, using orjson when it is installed.
+    
+    Args:
+        obj: The object to serialize.
+        indent (bool, optional): Pretty-print the output. Defaults to PRETTY_JSON.
+        
+    Returns:
+        str: The JSON encoded string.
+    """
+    if indent is None:
+        indent = PRETTY_JSON
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=4 if indent else None)
+
+def json_loads(data):
+    """Parse a JSON string or bytes, using orjson when it is installed.
+    
+    Args:
+        data (str | bytes): The JSON document.
+        
+    Returns:
+        The decoded object. Malformed input raises json.JSONDecodeError either way.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 async def get_location_from_ip(ip: str = None) -> dict:
     """Get location information from an IP address.
     
@@ -79,6 +79,22 @@ class TestBLE:
         
         assert result == "starting BLE scan...\n"
     
+    @pytest.mark.asyncio
+    async def test_ble_scan_timeout(self):
+        # Make the scan outlast the bounded timeout
+        import time
+        scan_mock = MagicMock(side_effect=lambda: time.sleep(0.5) or [])
+        sys.modules['meshtastic.ble_interface'].BLEInterface.scan = scan_mock
+        
+        register_ble(self.mcp, MagicMock())
+        ble_scan_func = self.registered_functions['ble_scan']
+        
+        with patch('MCPtastic.ble.BLE_SCAN_TIMEOUT', 0.05):
+            result = await ble_scan_func()
+        
+        assert result.startswith("starting BLE scan...\n")
+        assert "BLE scan timed out" in result
+    
     @pytest.mark.asyncio
     async def test_ble_connect_success(self):
         # Setup mock interface
@@ -1,16 +1,28 @@
 import unittest
+import asyncio
 import json
 import sqlite3
 import os
+import subprocess
+import sys
 from datetime import datetime
 from unittest.mock import MagicMock, patch, Mock
 import tempfile
 
 import meshtastic
+
+# device.py imports its siblings the way main.py loads it, with MCPtastic/ on the path
+MCPTASTIC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "MCPtastic"))
+if MCPTASTIC_DIR not in sys.path:
+    sys.path.append(MCPTASTIC_DIR)
+
 # Import the module to test
 from MCPtastic.device import (
     parse_meshtastic_output, 
+    collect_device_info,
     save_json_objects, 
+    queue_json_objects,
+    flush_json_objects,
     register_device_tools,
     splitCompoundName,
     traverseConfig,
@@ -18,6 +30,17 @@ from MCPtastic.device import (
     ex_config
 )
 
+class TestDeviceImport(unittest.TestCase):
+
+    def test_imports_as_top_level_module(self):
+        """main.py imports device before mesh, with only MCPtastic/ on sys.path."""
+        env = {k: v for k, v in os.environ.items() if k != "PYTHONPATH"}
+        result = subprocess.run(
+            [sys.executable, "-c", "import device"],
+            cwd=MCPTASTIC_DIR, env=env, capture_output=True, text=True,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+
 class TestDeviceModule(unittest.TestCase):
     
     def setUp(self):
@@ -98,6 +121,18 @@ Nodes in mesh: {
         self.assertEqual(result["Metadata"], {})
         self.assertEqual(result["Nodes"], {})
 
+    def test_parse_meshtastic_output_nested_objects(self):
+        """Test that nested objects on the MyInfo and Metadata lines are kept whole."""
+        content = (
+            'Owner: Test User\n'
+            'My info: { "myNodeNum": 1, "extra": { "a": 1 } }\n'
+            'Metadata: { "firmwareVersion": "2.5.1", "caps": { "wifi": true } }\n'
+        )
+        result = parse_meshtastic_output(content)
+        
+        self.assertEqual(result["MyInfo"], {"myNodeNum": 1, "extra": {"a": 1}})
+        self.assertEqual(result["Metadata"]["caps"], {"wifi": True})
+
     def test_parse_meshtastic_output_invalid_json(self):
         """Test parsing with invalid JSON content."""
         invalid_json_content = """Owner: Test User
@@ -115,6 +150,49 @@ Nodes in mesh: { more invalid json }
         self.assertEqual(result["Metadata"]["valid"], "json")
         self.assertEqual(result["Nodes"], {})
 
+    def test_collect_device_info(self):
+        """Test building device info directly from an interface."""
+        mock_iface = MagicMock()
+        mock_iface.getLongName.return_value = "Test User"
+        mock_iface.getShortName.return_value = "TU"
+        mock_iface.myInfo = None
+        mock_iface.metadata = None
+        mock_iface.nodes = {
+            "!12345678": {
+                "num": 1234567890,
+                "user": {"id": "!12345678", "longName": "Test User", "macaddr": "/c0gFyhb"},
+                "position": {"latitude": 34.1, "raw": object()},
+                "decoded": {"payload": b"ignored"}
+            }
+        }
+        
+        result = collect_device_info(mock_iface)
+        
+        self.assertEqual(result["Owner"], "Test User (TU)")
+        self.assertEqual(result["MyInfo"], {})
+        self.assertEqual(result["Metadata"], {})
+        node = result["Nodes"]["!12345678"]
+        self.assertEqual(node["user"]["macaddr"], "fd:cd:20:17:28:5b")
+        self.assertEqual(node["position"], {"latitude": 34.1})
+        self.assertNotIn("decoded", node)
+        # The interface's own node db must not be modified
+        self.assertIn("raw", mock_iface.nodes["!12345678"]["position"])
+        self.assertEqual(mock_iface.nodes["!12345678"]["user"]["macaddr"], "/c0gFyhb")
+
+    def test_collect_device_info_keeps_default_fields(self):
+        """Test that MyInfo and Metadata match showInfo's output, zero fields included."""
+        from meshtastic.protobuf.mesh_pb2 import DeviceMetadata, MyNodeInfo
+        mock_iface = MagicMock()
+        mock_iface.myInfo = MyNodeInfo(my_node_num=1234567890)
+        mock_iface.metadata = DeviceMetadata(firmware_version="2.5.0")
+        mock_iface.nodes = {}
+        
+        result = collect_device_info(mock_iface)
+        
+        self.assertEqual(result["MyInfo"], json.loads(meshtastic.util.message_to_json(mock_iface.myInfo)))
+        self.assertEqual(result["MyInfo"]["rebootCount"], 0)
+        self.assertEqual(result["Metadata"], json.loads(meshtastic.util.message_to_json(mock_iface.metadata)))
+
     def test_save_json_objects(self):
         """Test saving data to SQLite database."""
         test_data = {
@@ -230,6 +308,36 @@ Nodes in mesh: { more invalid json }
         
         conn.close()
 
+    def test_queue_json_objects(self):
+        """Test that queued data is written by the background writer."""
+        test_data = {
+            "Owner": "Queued User",
+            "Nodes": {"!12345678": {"user": {"longName": "Queued Node"}}}
+        }
+        
+        queue_json_objects(test_data, self.db_path)
+        flush_json_objects()
+        
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute("SELECT name FROM owner")
+        self.assertEqual(cursor.fetchone()[0], "Queued User")
+        cursor.execute("SELECT long_name FROM nodes WHERE id = '!12345678'")
+        self.assertEqual(cursor.fetchone()[0], "Queued Node")
+        conn.close()
+
+    def test_queue_json_objects_reuses_connection(self):
+        """Test that the writer opens each database once and keeps it open."""
+        import MCPtastic.device as device
+        with patch('MCPtastic.device._open_db', wraps=device._open_db) as mock_open_db:
+            queue_json_objects({"Owner": "First"}, self.db_path)
+            queue_json_objects({"Owner": "Second"}, self.db_path)
+            flush_json_objects()
+            mock_open_db.assert_called_once_with(self.db_path)
+        
+        device._close_db()
+        self.assertEqual(device._db_connections, {})
+
     def test_created_timestamp_preservation(self):
         """Test that created timestamp is preserved on updates."""
         # First insertion
@@ -277,6 +385,164 @@ Nodes in mesh: { more invalid json }
         # But the data should be updated
         self.assertEqual(new_name, "Updated Name")
 
+    def test_save_json_objects_returns_counts_without_printing(self):
+        """Test that saving reports what was written and keeps stdout clean."""
+        data = parse_meshtastic_output(self.test_content)
+        with patch('builtins.print') as mock_print:
+            result = save_json_objects(data, self.db_path)
+        
+        self.assertEqual(result, (True, 2, 2))
+        mock_print.assert_not_called()
+
+    def test_save_json_objects_many_nodes(self):
+        """Test that a batch of nodes is written in one call."""
+        nodes = {
+            f"!{i:08x}": {"user": {"longName": f"Node {i}"}, "snr": float(i)}
+            for i in range(50)
+        }
+        save_json_objects({"Nodes": nodes}, self.db_path)
+        
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM nodes")
+        self.assertEqual(cursor.fetchone()[0], 50)
+        cursor.execute("SELECT long_name, snr FROM nodes WHERE id = '!00000007'")
+        self.assertEqual(cursor.fetchone(), ("Node 7", 7.0))
+        conn.close()
+
+    def test_write_json_objects_skips_unchanged_nodes(self):
+        """Test that re-saving identical node data writes no rows."""
+        import MCPtastic.device as device
+        nodes = {
+            "!00000001": {"user": {"longName": "Static"}},
+            "!00000002": {"user": {"longName": "Moving"}, "snr": 1.0},
+        }
+        conn = device._open_db(self.db_path)
+        try:
+            device._write_json_objects(conn, {"Nodes": nodes})
+            before = conn.total_changes
+            device._write_json_objects(conn, {"Nodes": nodes})
+            self.assertEqual(conn.total_changes, before)
+            
+            nodes["!00000002"]["snr"] = 2.0
+            device._write_json_objects(conn, {"Nodes": nodes})
+            self.assertEqual(conn.total_changes, before + 1)
+        finally:
+            conn.close()
+
+    def test_write_json_objects_rolls_back_on_error(self):
+        """Test that a failed write leaves no partial snapshot behind."""
+        import MCPtastic.device as device
+        conn = device._open_db(self.db_path)
+        try:
+            with patch('MCPtastic.device.json_dumps', side_effect=[ValueError("bad node")]):
+                with self.assertRaises(ValueError):
+                    device._write_json_objects(conn, {"Owner": "Partial", "Nodes": {"!1": {}}})
+            self.assertFalse(conn.in_transaction)
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM owner").fetchone()[0], 0)
+        finally:
+            conn.close()
+
+    def test_save_json_objects_upgrades_legacy_nodes_table(self):
+        """Test that a nodes table with stored scalar columns is migrated."""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('''
+        CREATE TABLE nodes (
+            id TEXT PRIMARY KEY, long_name TEXT, node_data JSON,
+            created TIMESTAMP, last_updated DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+        ''')
+        conn.execute(
+            "INSERT INTO nodes (id, long_name, node_data, created) VALUES (?, ?, ?, ?)",
+            ("!00000001", "Old Node", '{"user": {"longName": "Old Node"}}', "2024-01-01T00:00:00")
+        )
+        conn.commit()
+        conn.close()
+        
+        save_json_objects({"Nodes": {"!00000002": {"user": {"longName": "New Node"}}}}, self.db_path)
+        
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute("SELECT id, long_name, created FROM nodes ORDER BY id")
+        rows = cursor.fetchall()
+        cursor.execute("SELECT sql FROM sqlite_master WHERE name = 'nodes'")
+        self.assertIn("WITHOUT ROWID", cursor.fetchone()[0])
+        conn.close()
+        self.assertEqual(rows[0], ("!00000001", "Old Node", "2024-01-01T00:00:00"))
+        self.assertEqual(rows[1][:2], ("!00000002", "New Node"))
+
+    def test_get_info_reports_failed_write(self):
+        """Test that get_info waits for the queued write and reports its outcome."""
+        import MCPtastic.device as device
+        registered_tools = {}
+        mock_mcp = MagicMock()
+        mock_mcp.tool.return_value = lambda func: registered_tools.setdefault(func.__name__, func)
+        mock_manager = MagicMock()
+        register_device_tools(mock_mcp, mock_manager)
+        info = {"Owner": "Test User (TU)", "MyInfo": {}, "Metadata": {}, "Nodes": {}}
+        
+        with patch('MCPtastic.device.collect_device_info', return_value=info), \
+             patch('MCPtastic.device._get_db', side_effect=lambda _: device._open_db(self.db_path)):
+            self.assertEqual(asyncio.run(registered_tools['get_info']()), "Device information saved to database")
+        
+        with patch('MCPtastic.device.collect_device_info', return_value=info), \
+             patch('MCPtastic.device._get_db', side_effect=sqlite3.OperationalError("disk I/O error")):
+            result = asyncio.run(registered_tools['get_info']())
+        self.assertEqual(result, "Error saving device information: disk I/O error")
+
+    def test_export_config_opens_interface_when_none_cached(self):
+        """Test that tools fall back to connecting through the interface manager."""
+        registered_tools = {}
+        mock_mcp = MagicMock()
+        mock_mcp.tool.return_value = lambda func: registered_tools.setdefault(func.__name__, func)
+        mock_manager = MagicMock()
+        mock_manager.get_interface.return_value = None
+        
+        register_device_tools(mock_mcp, mock_manager)
+        with patch('MCPtastic.device.ex_config', return_value="yaml") as mock_ex_config:
+            result = asyncio.run(registered_tools['export_config']())
+        
+        mock_manager.connect_default.assert_called_once_with()
+        mock_ex_config.assert_called_once_with(mock_manager.connect_default.return_value)
+        self.assertEqual(result, "yaml")
+
+    def test_configure_invalidates_static_info(self):
+        """Test that configure drops the cached owner names so a rename is read back at once."""
+        registered_tools = {}
+        mock_mcp = MagicMock()
+        mock_mcp.tool.return_value = lambda func: registered_tools.setdefault(func.__name__, func)
+        mock_manager = MagicMock()
+
+        register_device_tools(mock_mcp, mock_manager)
+        result = asyncio.run(registered_tools['configure']("owner: Renamed Node"))
+
+        self.assertEqual(result, "Setting device owner to Renamed Node")
+        mock_manager.get_interface.return_value.getNode.return_value.setOwner.assert_called_once_with("Renamed Node")
+        mock_manager.invalidate_static_info.assert_called_once_with()
+
+    def test_export_config_reports_connect_timeout(self):
+        """Test that a fallback connection timeout comes back as a structured error."""
+        from MCPtastic.interface_manager import ConnectTimeout
+        registered_tools = {}
+        mock_mcp = MagicMock()
+        mock_mcp.tool.return_value = lambda func: registered_tools.setdefault(func.__name__, func)
+        mock_manager = MagicMock()
+        mock_manager.get_interface.return_value = None
+        mock_manager.connect_default.side_effect = ConnectTimeout("meshtastic.local", 30, TimeoutError("no answer"))
+
+        register_device_tools(mock_mcp, mock_manager)
+        with patch('MCPtastic.device.ex_config') as mock_ex_config:
+            result = asyncio.run(registered_tools['export_config']())
+
+        mock_ex_config.assert_not_called()
+        self.assertEqual(json.loads(result), {
+            "status": "error",
+            "error": "timeout",
+            "hostname": "meshtastic.local",
+            "timeout": 30,
+            "message": "Timed out connecting to meshtastic.local after 30 seconds: no answer",
+        })
+
     @patch('MCPtastic.device.get_interface')
     def test_get_info_tool(self, mock_get_interface):
         """Test the get_info tool."""
@@ -372,6 +638,17 @@ Nodes in mesh: { more invalid json }
             
             self.assertTrue(result)
 
+    def test_traverse_config_deeply_nested(self):
+        """Test traverseConfig reaches every leaf of a deeply nested config."""
+        depth = 2000
+        config = {"leaf": 0}
+        for i in range(1, depth):
+            config = {"leaf": i, "child": config}
+        
+        with patch('MCPtastic.device.setPref') as mock_set_pref:
+            self.assertTrue(traverseConfig("root", config, MagicMock()))
+            self.assertEqual(mock_set_pref.call_count, depth)
+
     @patch('meshtastic.util')
     def test_set_pref(self, mock_util):
         """Test the setPref function."""
@@ -407,6 +684,32 @@ Nodes in mesh: { more invalid json }
             self.assertTrue(result)
             mock_util.fromStr.assert_called_with("test_value")
 
+    @patch('meshtastic.util')
+    def test_set_pref_unchanged_value(self, mock_util):
+        """Test setPref skips the write and log when the value is already set."""
+        mock_config = MagicMock()
+        mock_field = MagicMock()
+        mock_config.DESCRIPTOR.fields_by_name = {"test": mock_field}
+        mock_field.name = "test"
+        mock_field.message_type.fields_by_name = {"property": MagicMock()}
+        mock_field.message_type.fields_by_name["property"].name = "property"
+        mock_field.message_type.fields_by_name["property"].label = "LABEL_OPTIONAL"
+        mock_field.message_type.fields_by_name["property"].enum_type = None
+        mock_config.test = MagicMock(property="converted_value")
+        
+        mock_util.camel_to_snake.return_value = "property"
+        mock_util.snake_to_camel.return_value = "property"
+        mock_util.fromStr.return_value = "converted_value"
+        
+        with patch('builtins.print') as mock_print:
+            self.assertTrue(setPref(mock_config, "test.property", "converted_value"))
+            mock_print.assert_not_called()
+            
+            mock_util.fromStr.return_value = "new_value"
+            self.assertTrue(setPref(mock_config, "test.property", "new_value"))
+            self.assertEqual(mock_config.test.property, "new_value")
+            mock_print.assert_called_once()
+
     @patch('meshtastic.util')
     def test_set_pref_enum(self, mock_util):
         """Test setPref with enum values."""
@@ -535,6 +838,27 @@ Nodes in mesh: { more invalid json }
                         self.assertIn("config", config_obj)
                         self.assertIn("module_config", config_obj)
 
+    @patch('yaml.dump')
+    def test_ex_config_marks_base64_keys(self, mock_yaml_dump):
+        """Test that ex_config prefixes security keys and skips empty module sections."""
+        mock_yaml_dump.return_value = ""
+        mock_interface = MagicMock()
+        mock_interface.getMyNodeInfo.return_value = {}
+        
+        with patch('MCPtastic.device.MessageToDict') as mock_to_dict:
+            mock_to_dict.side_effect = [
+                {"security": {"privateKey": "cHJpdg==", "publicKey": "cHVi", "adminKey": ["YQ==", "Yg=="]}},
+                {"mqtt": {"enabled": True}, "serial": {}}
+            ]
+            ex_config(mock_interface)
+        
+        config_obj = mock_yaml_dump.call_args[0][0]
+        security = config_obj["config"]["security"]
+        self.assertEqual(security["privateKey"], "base64:cHJpdg==")
+        self.assertEqual(security["publicKey"], "base64:cHVi")
+        self.assertEqual(security["adminKey"], ["base64:YQ==", "base64:Yg=="])
+        self.assertEqual(config_obj["module_config"], {"mqtt": {"enabled": True}})
+
     @patch('meshtastic.tcp_interface.TCPInterface')
     @patch('meshtastic.util.support_info')
     def test_get_support_info_tool(self, mock_support_info, mock_interface):
@@ -26,7 +26,8 @@ sys.modules["meshtastic.ble_interface"].BLEInterface = mock_ble_interface_class
 sys.modules["meshtastic.serial_interface"].SerialInterface = mock_serial_interface_class
 
 # Now we can safely import the InterfaceManager
-from MCPtastic.interface_manager import InterfaceManager
+import socket
+from MCPtastic.interface_manager import ConnectTimeout, InterfaceManager, resolve_host, _resolve_cached
 
 class TestInterfaceManager(unittest.TestCase):
 
@@ -38,6 +39,7 @@ class TestInterfaceManager(unittest.TestCase):
         mock_tcp_interface.reset_mock()
         mock_ble_interface.reset_mock()
         mock_serial_interface.reset_mock()
+        mock_tcp_interface.isConnected.is_set.return_value = True
         
         # Create fresh instance for each test
         self.manager = InterfaceManager()
@@ -115,22 +117,66 @@ class TestInterfaceManager(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.manager.set_interface("192.168.1.100", "invalid_type")
 
-    def test_set_interface_closes_previous(self):
-        """Test that setting a new interface closes the previous one"""
-        # Set initial interface
+    def test_set_interface_keeps_previous_open(self):
+        """Test that setting a new interface keeps the previous one cached and open"""
+        first_iface = MagicMock()
+        second_iface = MagicMock()
         with patch('MCPtastic.interface_manager.meshtastic.tcp_interface.TCPInterface', 
-                  return_value=mock_tcp_interface):
+                  side_effect=[first_iface, second_iface]) as mock_class:
             self.manager.set_interface("first_host", "tcp")
+            self.manager.set_interface("second_host", "tcp")
+            # Switching back reuses the first connection
+            result = self.manager.set_interface("first_host", "tcp")
+            
+            self.assertEqual(mock_class.call_count, 2)
         
-        # Reset the mock to clear any previous calls
-        mock_tcp_interface.reset_mock()
-        
-        # Set new interface
+        first_iface.close.assert_not_called()
+        self.assertIs(result, first_iface)
+        self.assertIs(self.manager.get_interface(), first_iface)
+        self.assertIs(self.manager.get_interface("second_host"), second_iface)
+
+    def test_close_single_interface(self):
+        """Test that close with a hostname only closes that interface"""
+        first_iface = MagicMock()
+        second_iface = MagicMock()
         with patch('MCPtastic.interface_manager.meshtastic.tcp_interface.TCPInterface', 
-                  return_value=mock_tcp_interface):
+                  side_effect=[first_iface, second_iface]):
+            self.manager.set_interface("first_host", "tcp")
             self.manager.set_interface("second_host", "tcp")
         
-        # Verify previous interface was closed
+        self.manager.close("second_host", "tcp")
+        
+        second_iface.close.assert_called_once()
+        first_iface.close.assert_not_called()
+        self.assertIsNone(self.manager.get_interface())
+        self.assertIs(self.manager.get_interface("first_host"), first_iface)
+        
+        self.manager.close_all()
+        first_iface.close.assert_called_once()
+        self.assertIsNone(self.manager.get_interface("first_host"))
+
+    def test_set_interface_reuses_connected_interface(self):
+        """Test that setting the same host and type again reuses the open interface"""
+        with patch('MCPtastic.interface_manager.meshtastic.tcp_interface.TCPInterface', 
+                  return_value=mock_tcp_interface) as mock_class:
+            first = self.manager.set_interface("same_host", "tcp")
+            second = self.manager.set_interface("same_host", "tcp")
+
+            mock_class.assert_called_once()
+
+        self.assertIs(first, second)
+        mock_tcp_interface.close.assert_not_called()
+
+    def test_set_interface_reconnects_when_disconnected(self):
+        """Test that a disconnected cached interface is replaced"""
+        with patch('MCPtastic.interface_manager.meshtastic.tcp_interface.TCPInterface', 
+                  return_value=mock_tcp_interface) as mock_class:
+            self.manager.set_interface("same_host", "tcp")
+            mock_tcp_interface.isConnected.is_set.return_value = False
+            self.manager.set_interface("same_host", "tcp")
+
+            self.assertEqual(mock_class.call_count, 2)
+
         mock_tcp_interface.close.assert_called_once()
 
     def test_set_interface_with_custom_parameters(self):
@@ -154,6 +200,49 @@ class TestInterfaceManager(unittest.TestCase):
                 hostname, debug_out, no_proto, connect_now, port_number, no_nodes
             )
 
+    def test_set_interface_passes_timeout(self):
+        """Test that an explicit timeout is forwarded to the interface"""
+        with patch('MCPtastic.interface_manager.meshtastic.tcp_interface.TCPInterface', 
+                  return_value=mock_tcp_interface) as mock_class:
+            self.manager.set_interface("192.168.1.100", "tcp", timeout=5)
+            
+            mock_class.assert_called_once_with(
+                "192.168.1.100", None, False, True, 4403, False, timeout=5
+            )
+
+    def test_set_interface_tunes_tcp_socket(self):
+        """Test that new TCP interfaces get Nagle disabled and keepalive enabled"""
+        with patch('MCPtastic.interface_manager.meshtastic.tcp_interface.TCPInterface', 
+                  return_value=mock_tcp_interface):
+            self.manager.set_interface("192.168.1.100", "tcp")
+        
+        sock = mock_tcp_interface.socket
+        sock.setsockopt.assert_any_call(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt.assert_any_call(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+    def test_default_hostname_from_environment(self):
+        """Test that MESHTASTIC_HOST overrides the default device"""
+        import importlib
+        import os
+        import MCPtastic.interface_manager as interface_manager
+        try:
+            with patch.dict(os.environ, {"MESHTASTIC_HOST": "10.0.0.9"}):
+                self.assertEqual(importlib.reload(interface_manager).DEFAULT_HOSTNAME, "10.0.0.9")
+        finally:
+            importlib.reload(interface_manager)
+        self.assertEqual(interface_manager.DEFAULT_HOSTNAME, "meshtastic.local")
+
+    def test_set_interface_resolves_mdns_hostname_once(self):
+        """Test that .local hostnames are resolved once and reused"""
+        _resolve_cached.cache_clear()
+        with patch('MCPtastic.interface_manager.socket.gethostbyname', 
+                  return_value="10.0.0.5") as mock_resolve:
+            self.assertEqual(resolve_host("radio.local"), "10.0.0.5")
+            self.assertEqual(resolve_host("radio.local"), "10.0.0.5")
+            self.assertEqual(resolve_host("192.168.1.100"), "192.168.1.100")
+            
+            mock_resolve.assert_called_once_with("radio.local")
+
     def test_get_interface(self):
         """Test getting the cached interface"""
         # Set an interface first
@@ -167,6 +256,158 @@ class TestInterfaceManager(unittest.TestCase):
         # Verify we got the cached interface
         self.assertEqual(result, mock_tcp_interface)
         
+    def test_get_connected_interface(self):
+        """Test that the current interface is reused, reconnected, or the default opened"""
+        with patch('MCPtastic.interface_manager.resolve_host', side_effect=lambda host: host), \
+             patch('MCPtastic.interface_manager.meshtastic.tcp_interface.TCPInterface', 
+                  return_value=mock_tcp_interface) as mock_class:
+            # Nothing set yet, the default device is opened
+            self.assertIs(self.manager.get_connected_interface(), mock_tcp_interface)
+            mock_class.assert_called_once_with("meshtastic.local", None, False, True, 4403, False, timeout=30)
+            
+            # Connected, reused as-is
+            self.manager.get_connected_interface()
+            self.assertEqual(mock_class.call_count, 1)
+            
+            # Dropped, reconnected to the same device
+            mock_tcp_interface.isConnected.is_set.return_value = False
+            self.manager.get_connected_interface()
+            self.assertEqual(mock_class.call_count, 2)
+            self.assertEqual(mock_class.call_args[0][0], "meshtastic.local")
+
+    def test_connect_default_times_out(self):
+        """Test that the default connection gives up after DEFAULT_CONNECT_TIMEOUT with a structured error"""
+        class MeshInterfaceError(Exception):
+            pass
+
+        with patch('MCPtastic.interface_manager.meshtastic.mesh_interface.MeshInterface.MeshInterfaceError',
+                  MeshInterfaceError, create=True), \
+             patch('MCPtastic.interface_manager.resolve_host', side_effect=lambda host: host), \
+             patch('MCPtastic.interface_manager.meshtastic.tcp_interface.TCPInterface',
+                  side_effect=MeshInterfaceError("Timed out waiting for connection completion")) as mock_class:
+            with self.assertRaises(ConnectTimeout) as ctx:
+                self.manager.connect_default()
+
+        mock_class.assert_called_once_with("meshtastic.local", None, False, True, 4403, False, timeout=30)
+        self.assertIsInstance(ctx.exception, TimeoutError)
+        self.assertEqual(ctx.exception.as_dict(), {
+            "status": "error",
+            "error": "timeout",
+            "hostname": "meshtastic.local",
+            "timeout": 30,
+            "message": "Timed out connecting to meshtastic.local after 30 seconds: Timed out waiting for connection completion",
+        })
+        self.assertIsNone(self.manager.get_interface())
+
+    def test_listeners_subscribed_while_interfaces_open(self):
+        """Test that pubsub listeners are subscribed on connect and dropped once every interface is closed"""
+        listener = MagicMock()
+        self.manager.add_listener(listener, "meshtastic.receive")
+        with patch('MCPtastic.interface_manager.pub') as mock_pub, \
+             patch('MCPtastic.interface_manager.meshtastic.tcp_interface.TCPInterface', 
+                  return_value=mock_tcp_interface):
+            self.manager.set_interface("first_host", "tcp")
+            self.manager.set_interface("second_host", "tcp")
+            mock_pub.subscribe.assert_called_once_with(listener, "meshtastic.receive")
+            
+            self.manager.close("first_host")
+            mock_pub.unsubscribe.assert_not_called()
+            self.manager.close("second_host")
+            mock_pub.unsubscribe.assert_called_once_with(listener, "meshtastic.receive")
+            
+            self.manager.set_interface("first_host", "tcp")
+            self.assertEqual(mock_pub.subscribe.call_count, 2)
+            self.manager.close_all()
+            self.assertEqual(mock_pub.unsubscribe.call_count, 2)
+
+    def test_invalidate_static_info(self):
+        """Test that invalidating drops every cached device value"""
+        self.manager.static_cache["long_name"] = (0, mock_tcp_interface, None, "Old Name")
+        self.manager.invalidate_static_info()
+        self.assertEqual(self.manager.static_cache, {})
+
+    def test_reconnect_replaces_current_interface(self):
+        """Test that reconnect closes a broken interface and opens the same device again"""
+        broken = MagicMock()
+        fresh = MagicMock()
+        with patch('MCPtastic.interface_manager.meshtastic.tcp_interface.TCPInterface', 
+                  side_effect=[broken, fresh]) as mock_class:
+            self.manager.set_interface("192.168.1.100", "tcp")
+            self.assertIs(self.manager.reconnect(broken), fresh)
+            # A second caller holding the old interface gets the replacement without reconnecting
+            self.assertIs(self.manager.reconnect(broken), fresh)
+            self.assertEqual(mock_class.call_count, 2)
+        
+        broken.close.assert_called_once()
+        self.assertIs(self.manager.get_interface("192.168.1.100"), fresh)
+
+    def test_close_idle(self):
+        """Test that idle interfaces are closed but the current one is kept"""
+        first_iface = MagicMock()
+        second_iface = MagicMock()
+        with patch('MCPtastic.interface_manager.meshtastic.tcp_interface.TCPInterface', 
+                  side_effect=[first_iface, second_iface]):
+            self.manager.set_interface("first_host", "tcp")
+            self.manager.set_interface("second_host", "tcp")
+        
+        self.manager.close_idle(idle_timeout=3600)
+        first_iface.close.assert_not_called()
+        
+        self.manager.close_idle(idle_timeout=-1)
+        first_iface.close.assert_called_once()
+        second_iface.close.assert_not_called()
+        self.assertIsNone(self.manager.get_interface("first_host"))
+        self.assertIs(self.manager.get_interface(), second_iface)
+
+    def test_close_idle_survives_failing_close(self):
+        """Test that an interface whose close() raises is still dropped"""
+        first_iface = MagicMock()
+        first_iface.close.side_effect = OSError("socket already gone")
+        with patch('MCPtastic.interface_manager.meshtastic.tcp_interface.TCPInterface', 
+                  side_effect=[first_iface, MagicMock()]):
+            self.manager.set_interface("first_host", "tcp")
+            self.manager.set_interface("second_host", "tcp")
+        
+        self.manager.close_idle(idle_timeout=-1)
+        
+        first_iface.close.assert_called_once()
+        self.assertIsNone(self.manager.get_interface("first_host"))
+        self.assertNotIn(("first_host", "tcp"), self.manager._last_used)
+
+    def test_idle_reaper_runs_without_tool_calls(self):
+        """Test that the background reaper closes idle interfaces and stops on close_all"""
+        with patch('MCPtastic.interface_manager.threading.Thread') as mock_thread:
+            self.manager.set_interface("first_host", "tcp")
+            self.manager.set_interface("first_host", "tcp")
+            
+            mock_thread.assert_called_once()
+            target = mock_thread.call_args.kwargs["target"]
+        
+        with patch.object(self.manager, 'close_idle', side_effect=lambda: self.manager.close_all()) as mock_close_idle, \
+             patch('MCPtastic.interface_manager.IDLE_REAP_INTERVAL', 0):
+            # The first pass closes everything, close_all then stops the loop
+            target()
+        
+        mock_close_idle.assert_called_once_with()
+        self.assertIsNone(self.manager.get_interface())
+
+    def test_prewarm_connects_once_in_background(self):
+        """Test that prewarm opens the default interface on a background thread only once"""
+        with patch('MCPtastic.interface_manager.threading.Thread') as mock_thread:
+            self.manager.prewarm()
+            self.manager.prewarm()
+            
+            mock_thread.assert_called_once()
+            target = mock_thread.call_args.kwargs["target"]
+        
+        with patch.object(self.manager, 'set_interface') as mock_set_interface:
+            target()
+            mock_set_interface.assert_called_once_with("meshtastic.local", "tcp")
+            
+            # A failed connection is swallowed, the tools will retry
+            mock_set_interface.side_effect = Exception("unreachable")
+            target()
+
     def test_get_interface_when_none_set(self):
         """Test getting the interface when none has been set"""
         # Get the interface without setting one first
@@ -201,5 +442,22 @@ class TestInterfaceManager(unittest.TestCase):
         # The manager should return None since the hostnames don't match
         self.assertIsNone(result)
 
+    def test_close(self):
+        """Test that close shuts down the cached interface and clears state"""
+        with patch('MCPtastic.interface_manager.meshtastic.tcp_interface.TCPInterface', 
+                  return_value=mock_tcp_interface):
+            self.manager.set_interface("192.168.1.100", "tcp")
+
+        self.manager.close()
+
+        mock_tcp_interface.close.assert_called_once()
+        self.assertIsNone(self.manager.get_interface())
+        self.assertIsNone(self.manager._cached_hostname)
+
+    def test_close_when_none_set(self):
+        """Test that close is a no-op when no interface has been set"""
+        self.manager.close()
+        self.assertIsNone(self.manager.get_interface())
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -2,7 +2,9 @@ import pytest
 import pytest_asyncio  # Add this import
 import json
 import datetime
-from unittest.mock import Mock, patch, MagicMock
+import inspect
+import time
+from unittest.mock import Mock, patch, MagicMock, call
 import sys
 from typing import Any, List, Optional, Union
 import os
@@ -47,91 +49,326 @@ def mock_interface() -> MagicMock:
     return mock
 
 @pytest.fixture
-def mcp_with_tools() -> MockMCP:
+def iface_manager(mock_interface: MagicMock) -> MagicMock:
+    """Create a mock interface manager that hands out the mock interface"""
+    manager = MagicMock()
+    manager.get_interface.return_value = mock_interface
+    manager.static_cache = {}
+    return manager
+
+@pytest.fixture
+def mcp_with_tools(iface_manager: MagicMock) -> MockMCP:
     """Initialize MCP and register tools"""
     mcp = MockMCP()
-    mesh.register_mesh_tools(mcp)
+    mesh.register_mesh_tools(mcp, iface_manager)
     return mcp
 
 # Mark all async tests with pytest.mark.asyncio
 @pytest.mark.asyncio
-@patch('meshtastic.tcp_interface.TCPInterface')
-async def test_get_long_name(mock_tcp: Mock, mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
+async def test_get_long_name(mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
     """Test the get_long_name tool"""
-    mock_tcp.return_value = mock_interface
-    
     # Call the tool
     result = await mcp_with_tools.tools["get_long_name"]()
     
-    # Verify the interface was created and closed properly
-    mock_tcp.assert_called_once_with("meshtastic.local")
+    # Verify the shared interface was used and left open for the next tool
     mock_interface.getLongName.assert_called_once()
-    mock_interface.close.assert_called_once()
+    mock_interface.close.assert_not_called()
     
     # Verify the result
     assert result == "Test Node Long Name"
 
 @pytest.mark.asyncio
-@patch('meshtastic.tcp_interface.TCPInterface')
-async def test_get_short_name(mock_tcp: Mock, mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
-    """Test the get_short_name tool"""
-    mock_tcp.return_value = mock_interface
+async def test_get_hardware(mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
+    """Test the get_hardware tool looks up our own node directly"""
+    
+    mock_interface.myInfo.my_node_num = 123456
+    mock_interface.nodesByNum = {123456: {"num": 123456, "user": {"hwModel": "TBEAM"}}}
+    assert await mcp_with_tools.tools["get_hardware"]() == "TBEAM"
+    
+    # A node without user info yet reports no hardware
+    mock_interface.nodesByNum = {123456: {"num": 123456}}
+    assert await mcp_with_tools.tools["get_hardware"]() == ""
+
+@pytest.mark.asyncio
+async def test_static_info_is_cached(mcp_with_tools: MockMCP, iface_manager: MagicMock, mock_interface: MagicMock) -> None:
+    """Test that static device info is read once per TTL window and per interface"""
+    
+    assert await mcp_with_tools.tools["get_my_user"]() == await mcp_with_tools.tools["get_my_user"]()
+    mock_interface.getMyUser.assert_called_once()
+    
+    # A different interface is never served the old value
+    other_interface = MagicMock()
+    other_interface.getMyUser.return_value = {"id": "!other"}
+    iface_manager.get_interface.return_value = other_interface
+    assert json.loads(await mcp_with_tools.tools["get_my_user"]()) == {"id": "!other"}
+    
+    # Once the TTL passes the value is read again
+    later = mesh.time.monotonic() + mesh.STATIC_INFO_TTL + 1
+    with patch('MCPtastic.mesh.time.monotonic', return_value=later):
+        await mcp_with_tools.tools["get_my_user"]()
+    assert other_interface.getMyUser.call_count == 2
+    
+    # The public key is kept for as long as the interface lives
+    other_interface.getPublicKey.return_value = "otherkey"
+    await mcp_with_tools.tools["get_public_key"]()
+    with patch('MCPtastic.mesh.time.monotonic', return_value=later + 3600):
+        await mcp_with_tools.tools["get_public_key"]()
+    other_interface.getPublicKey.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_static_tools_take_no_arguments(mcp_with_tools: MockMCP, iface_manager: MagicMock, mock_interface: MagicMock) -> None:
+    """Test that decorated tools keep their names, docs and signatures without the interface"""
+    
+    tool = mcp_with_tools.tools["get_long_name"]
+    assert tool.__doc__ == "Get the long name of the device."
+    assert inspect.signature(tool).parameters == {}
+    
+    mock_interface.getShortName.side_effect = Exception("radio gone")
+    assert await mcp_with_tools.tools["get_short_name"]() == "Error: radio gone"
+    
+    # Tools taking the shared interface don't expose it as a parameter
+    assert list(inspect.signature(mcp_with_tools.tools["show_nodes"]).parameters) == ["includeSelf", "showFields"]
+    iface_manager.get_interface.side_effect = Exception("no radio")
+    assert json.loads(await mcp_with_tools.tools["send_heartbeat"]()) == {"status": "error", "message": "no radio"}
+
+@pytest.mark.asyncio
+async def test_show_nodes_reuses_table_until_nodes_change(mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
+    """Test that show_nodes only re-renders after the radio reports new packets"""
+    
+    assert await mcp_with_tools.tools["show_nodes"]() == "node1: Test Node\nnode2: Other Node"
+    await mcp_with_tools.tools["show_nodes"]()
+    mock_interface.showNodes.assert_called_once_with(True, None)
+    
+    # A different field selection is rendered separately
+    await mcp_with_tools.tools["show_nodes"](showFields=["user.longName"])
+    assert mock_interface.showNodes.call_count == 2
+    
+    mesh._on_receive({"from": 1}, mock_interface)
+    await mcp_with_tools.tools["show_nodes"](showFields=["user.longName"])
+    assert mock_interface.showNodes.call_count == 3
+    
+    later = mesh.time.monotonic() + mesh.NODE_TABLE_TTL + 1
+    with patch('MCPtastic.mesh.time.monotonic', return_value=later):
+        await mcp_with_tools.tools["show_nodes"](showFields=["user.longName"])
+    assert mock_interface.showNodes.call_count == 4
+
+@pytest.mark.asyncio
+async def test_show_nodes_ndjson(mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
+    """Test that show_nodes_ndjson emits one JSON line per node with the selected fields"""
+    mock_interface.myInfo.my_node_num = 1
+    mock_interface.nodesByNum = {
+        1: {"num": 1, "user": {"longName": "Me", "hwModel": "TBEAM"}},
+        2: {"num": 2, "user": {"longName": "Other"}},
+    }
+    
+    lines = (await mcp_with_tools.tools["show_nodes_ndjson"]()).splitlines()
+    assert [json.loads(line)["num"] for line in lines] == [1, 2]
+    
+    result = await mcp_with_tools.tools["show_nodes_ndjson"](includeSelf=False, showFields=["user.longName", "user.hwModel"])
+    assert [json.loads(line) for line in result.splitlines()] == [{"user.longName": "Other", "user.hwModel": None}]
+
+@pytest.mark.asyncio
+async def test_send_data_binary_payloads(mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
+    """Test that send_data passes bytes through and decodes base64 strings"""
+    
+    await mcp_with_tools.tools["send_data"]("AAH/", b64=True)
+    assert mock_interface.sendData.call_args[0][0] == b"\x00\x01\xff"
+    await mcp_with_tools.tools["send_data"](b"\x00\x02")
+    assert mock_interface.sendData.call_args[0][0] == b"\x00\x02"
+    await mcp_with_tools.tools["send_data"]("hi")
+    assert mock_interface.sendData.call_args[0][0] == b"hi"
+    
+    assert await mcp_with_tools.tools["send_data"]("x" * 30) == f"Data sent: {'x' * 20}... to port 256"
+
+@pytest.mark.asyncio
+async def test_send_texts_batch(mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
+    """Test that send_texts sends each message in order on one interface"""
+    mock_interface.sendText.side_effect = [Mock(id=1), Exception("radio busy")]
+    
+    result = json.loads(await mcp_with_tools.tools["send_texts"]([
+        {"text": "one"},
+        {"text": "two", "destinationId": "!abcdef", "channelIndex": 2},
+        {"text": "x" * 300},
+    ]))
+    
+    assert [r["status"] for r in result] == ["success", "error", "error"]
+    assert result[0]["id"] == 1
+    assert mock_interface.sendText.call_args_list == [
+        call("one", "^all", False, False, None, 0, 1),
+        call("two", "!abcdef", False, False, None, 2, 1),
+    ]
+
+@pytest.mark.asyncio
+async def test_recv_packets_drains_received(mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
+    """Test that recv_packets returns buffered packets once, without the raw protobuf"""
+    mesh._received_packets.clear()
+    
+    mesh._on_receive({"from": 1, "raw": object(), "decoded": {"payload": b"\x00\x01"}}, mock_interface)
+    
+    assert json.loads(await mcp_with_tools.tools["recv_packets"]()) == [{"from": 1, "decoded": {"payload": "AAE="}}]
+    assert json.loads(await mcp_with_tools.tools["recv_packets"]()) == []
+
+@pytest.mark.asyncio
+async def test_rename_visible_immediately(mock_interface: MagicMock) -> None:
+    """Test that names read after set_owner come from the device, not the cache"""
+    from MCPtastic.interface_manager import InterfaceManager
+    from MCPtastic.node import register_node_tools
+    
+    manager = InterfaceManager()
+    mcp = MockMCP()
+    with patch.object(manager, "get_interface", return_value=mock_interface):
+        mesh.register_mesh_tools(mcp, manager)
+        register_node_tools(mcp, manager)
+        
+        assert await mcp.tools["get_long_name"]() == "Test Node Long Name"
+        assert await mcp.tools["get_short_name"]() == "TN"
+        
+        mock_interface.getLongName.return_value = "Renamed Node"
+        mock_interface.getShortName.return_value = "RN"
+        result = json.loads(await mcp.tools["set_owner"](long_name="Renamed Node", short_name="RN"))
+        
+        assert result["status"] == "success"
+        mock_interface.setOwner.assert_called_once_with("Renamed Node", "RN", False)
+        assert await mcp.tools["get_long_name"]() == "Renamed Node"
+        assert await mcp.tools["get_short_name"]() == "RN"
+
+@pytest.mark.asyncio
+async def test_recv_packets_wakes_on_packet(mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
+    """Test that a waiting recv_packets returns as soon as the reader thread delivers a packet"""
+    import threading
+    mesh._received_packets.clear()
+    
+    timer = threading.Timer(0.05, mesh._on_receive, args=({"from": 2}, mock_interface))
+    timer.start()
+    start = time.monotonic()
+    packets = json.loads(await mcp_with_tools.tools["recv_packets"](timeout=10))
+    timer.join()
+    
+    assert packets == [{"from": 2}]
+    assert time.monotonic() - start < 5
+    assert not mesh._packet_waiters
+
+def test_register_mesh_tools_adds_listeners(iface_manager: MagicMock) -> None:
+    """Test that the pubsub listeners are handed to the interface manager"""
+    mesh.register_mesh_tools(MockMCP(), iface_manager)
+    
+    iface_manager.add_listener.assert_any_call(mesh._on_receive, "meshtastic.receive")
+    iface_manager.add_listener.assert_any_call(mesh._on_node_updated, "meshtastic.node.updated")
+
+@pytest.mark.asyncio
+async def test_send_retries_once_after_broken_socket(mcp_with_tools: MockMCP, iface_manager: MagicMock, mock_interface: MagicMock) -> None:
+    """Test that a send reconnects and retries when the socket has gone away"""
+    broken = MagicMock()
+    broken.sendTelemetry.side_effect = BrokenPipeError()
+    iface_manager.get_interface.return_value = broken
+    iface_manager.reconnect.return_value = mock_interface
+    
+    assert await mcp_with_tools.tools["send_telemetry"]() == "Telemetry sent: device_metrics"
+    iface_manager.reconnect.assert_called_once_with(broken)
+    mock_interface.sendTelemetry.assert_called_once_with(BROADCAST_ADDR, False, 0, "device_metrics")
+
+@pytest.mark.asyncio
+async def test_send_text_chunk_gap_includes_send_time(mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
+    """Test that chunk pacing only sleeps for what is left of the half second after each send"""
+    mock_interface.sendText.side_effect = lambda *args: time.sleep(0.2)
+    
+    with patch('MCPtastic.mesh.asyncio.sleep') as mock_sleep:
+        await mcp_with_tools.tools["send_text"]("word " * 100)
+    
+    assert mock_interface.sendText.call_count == 3
+    assert mock_sleep.call_count == 2
+    assert all(0 < c.args[0] < 0.4 for c in mock_sleep.call_args_list)
+
+def test_chunk_text_splits_on_bytes() -> None:
+    """Test that chunks fit the byte limit, keep characters whole and break at spaces"""
+    text = "word " * 100 + "😀" * 100
+    chunks = mesh._chunk_text(text, 50)
+    
+    assert all(len(chunk.encode('utf-8')) <= 50 for chunk in chunks)
+    assert "".join(chunk.split("] ", 1)[1] for chunk in chunks) == text
+    assert chunks[0].startswith(f"[1/{len(chunks)}] ")
+    assert chunks[0].endswith(" ")
+    # Already encoded text is chunked the same way
+    assert mesh._chunk_text(text.encode('utf-8'), 50) == chunks
+    # The prefix grows to three digits once there are 100+ chunks
+    many = mesh._chunk_text("x" * 5000, 30)
+    assert len(many) >= 100 and all(len(chunk.encode('utf-8')) <= 30 for chunk in many)
+
+def test_iso_to_epoch_is_memoized() -> None:
+    """Test that waypoint expiry strings are parsed once, as UTC when naive"""
+    mesh._iso_to_epoch.cache_clear()
+    assert mesh._iso_to_epoch("2025-10-01T00:00:00") == 1759276800
+    assert mesh._iso_to_epoch("2025-10-01T00:00:00") == 1759276800
+    assert mesh._iso_to_epoch.cache_info().hits == 1
+    # An explicit offset is honoured
+    assert mesh._iso_to_epoch("2025-10-01T02:00:00+02:00") == 1759276800
+
+@pytest.mark.asyncio
+async def test_fire_and_forget_sends_are_queued(mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
+    """Test that heartbeat and alert go out through the background sender"""
+    
+    assert json.loads(await mcp_with_tools.tools["send_heartbeat"]())["status"] == "queued"
+    assert await mcp_with_tools.tools["send_alert"]("hello", "!abcdef", 1) == "Alert queued: hello"
+    mesh.flush_sends()
     
+    mock_interface.sendHeartbeat.assert_called_once_with()
+    mock_interface.sendAlert.assert_called_once_with("hello", "!abcdef", None, 1)
+
+@pytest.mark.asyncio
+async def test_send_traceroute_waits_for_the_radio(mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
+    """Test that traceroute bypasses the send queue and reports its outcome"""
+    mock_interface.sendTraceRoute.return_value = None
+    
+    result = json.loads(await mcp_with_tools.tools["send_traceroute"]("!abcdef", 3))
+    
+    assert result == {"status": "success", "message": "Traceroute sent to !abcdef"}
+    mock_interface.sendTraceRoute.assert_called_once_with("!abcdef", 3, 0)
+
+@pytest.mark.asyncio
+async def test_get_short_name(mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
+    """Test the get_short_name tool"""
     # Call the tool
     result = await mcp_with_tools.tools["get_short_name"]()
     
-    # Verify the interface was created and closed properly
-    mock_tcp.assert_called_once_with("meshtastic.local")
+    # Verify the shared interface was used and left open
     mock_interface.getShortName.assert_called_once()
-    mock_interface.close.assert_called_once()
+    mock_interface.close.assert_not_called()
     
     # Verify the result
     assert result == "TN"
 
 @pytest.mark.asyncio
-@patch('meshtastic.tcp_interface.TCPInterface')
-async def test_get_my_node_info(mock_tcp: Mock, mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
+async def test_get_my_node_info(mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
     """Test the get_my_node_info tool"""
-    mock_tcp.return_value = mock_interface
-    
     # Call the tool
     result = await mcp_with_tools.tools["get_my_node_info"]()
     
-    # Verify the interface was created and closed properly
-    mock_tcp.assert_called_once_with("meshtastic.local")
+    # Verify the shared interface was used and left open
     mock_interface.getMyNodeInfo.assert_called_once()
-    mock_interface.close.assert_called_once()
+    mock_interface.close.assert_not_called()
     
     # Verify the result is properly converted to JSON
-    expected = json.dumps({"id": "!abcdef", "num": 123456}, indent=4)
-    assert result == expected
+    assert json.loads(result) == {"id": "!abcdef", "num": 123456}
 
 @pytest.mark.asyncio
-@patch('meshtastic.tcp_interface.TCPInterface')
-async def test_send_text_short(mock_tcp: Mock, mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
+async def test_send_text_short(mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
     """Test the send_text tool with a short message that doesn't need chunking"""
-    mock_tcp.return_value = mock_interface
-    
     # Call the tool with a short message that won't need chunking
     result = await mcp_with_tools.tools["send_text"]("Hello, mesh!")
     
-    # Verify the interface was created and closed properly
-    mock_tcp.assert_called_once_with("meshtastic.local")
+    # Verify the message went out once on the shared interface
     mock_interface.sendText.assert_called_once_with(
         "Hello, mesh!", "^all", False, False, None, 0, 1
     )
-    mock_interface.close.assert_called_once()
+    mock_interface.close.assert_not_called()
     
     # Verify the result with the new format
     assert result == "Message sent: Hello, mesh!"
 
 @pytest.mark.asyncio
-@patch('meshtastic.tcp_interface.TCPInterface')
 @patch('asyncio.sleep')  # Add this to verify the delay is called
-async def test_send_text_chunked(mock_sleep: Mock, mock_tcp: Mock, mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
+async def test_send_text_chunked(mock_sleep: Mock, mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
     """Test the send_text tool with a long message that needs chunking"""
-    mock_tcp.return_value = mock_interface
-    
     # Create a long message with clear word boundaries
     # This message should get split at word boundaries when possible
     long_message = "This is a test message with multiple words that should be split at word boundaries. " * 10
@@ -139,10 +376,6 @@ async def test_send_text_chunked(mock_sleep: Mock, mock_tcp: Mock, mcp_with_tool
     # Call the tool
     result = await mcp_with_tools.tools["send_text"](long_message)
     
-    # Verify the interface was created and closed once
-    mock_tcp.assert_called_once_with("meshtastic.local")
-    mock_interface.close.assert_called_once()
-    
     # Verify that sendText was called multiple times
     assert mock_interface.sendText.call_count >= 2
     
@@ -154,9 +387,9 @@ async def test_send_text_chunked(mock_sleep: Mock, mock_tcp: Mock, mcp_with_tool
     # It should be called one less time than the number of chunks (no delay before first chunk)
     assert mock_sleep.call_count == mock_interface.sendText.call_count - 1
     
-    # Check that sleep was called with 0.5 seconds
+    # Each gap is what is left of the half second after the previous send
     for call in mock_sleep.call_args_list:
-        assert call[0][0] == 0.5
+        assert 0 < call[0][0] <= 0.5
     
     # Verify word boundary splitting by checking each chunk
     for call_args in mock_interface.sendText.call_args_list:
@@ -174,13 +407,10 @@ async def test_send_text_chunked(mock_sleep: Mock, mock_tcp: Mock, mcp_with_tool
     assert "Sent chunk: [1/" in result
 
 @pytest.mark.asyncio
-@patch('meshtastic.tcp_interface.TCPInterface')
-async def test_send_text_edge_case(mock_tcp: Mock, mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
+async def test_send_text_edge_case(mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
     """Test the send_text tool with a message that's exactly at the MAX_TEXT_SIZE limit"""
-    mock_tcp.return_value = mock_interface
-    
     # Create a message that's exactly at the limit
-    edge_message = "This is a message that's exactly at the size limit."
+    edge_message = "x" * mesh.MAX_TEXT_SIZE
     
     # Call the tool
     result = await mcp_with_tools.tools["send_text"](edge_message)
@@ -195,11 +425,9 @@ async def test_send_text_edge_case(mock_tcp: Mock, mcp_with_tools: MockMCP, mock
     assert result == f"Message sent: {edge_message}"
 
 @pytest.mark.asyncio
-@patch('meshtastic.tcp_interface.TCPInterface')
-async def test_send_text_unicode(mock_tcp: Mock, mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
+@patch('asyncio.sleep')
+async def test_send_text_unicode(mock_sleep: Mock, mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
     """Test the send_text tool with Unicode characters"""
-    mock_tcp.return_value = mock_interface
-    
     # Create a Unicode message that's long enough to trigger chunking
     # Each emoji is 4 bytes in UTF-8, so this should be plenty
     unicode_message = "😀" * 100
@@ -207,102 +435,69 @@ async def test_send_text_unicode(mock_tcp: Mock, mcp_with_tools: MockMCP, mock_i
     # Call the tool
     result = await mcp_with_tools.tools["send_text"](unicode_message)
     
-    # Verify the interface was properly closed
-    mock_interface.close.assert_called_once()
-    
-    # Verify result contains something about the message being sent
-    assert "Sent chunk:" in result or "Message sent:" in result
-    
-    # If the message was chunked, verify no emoji was split
-    if "Sent chunk:" in result:
-        for call_args in mock_interface.sendText.call_args_list:
-            message = call_args[0][0]
-            # Remove the chunk prefix like [1/2]
-            if "]" in message:
-                content = message.split("]", 1)[1].strip()
-            else:
-                content
-            
-            # Check for orphaned UTF-8 continuation bytes
-            # If an emoji was split, we'd have invalid UTF-8
-            try:
-                content.encode('utf-8').decode('utf-8')
-            except UnicodeError:
-                pytest.fail("Invalid UTF-8 detected - a character might have been split")
+    # Verify the message was chunked
+    assert "Sent chunk:" in result
+    assert mock_interface.sendText.call_count >= 2
+    
+    # Verify no emoji was split: the chunks reassemble to the original text
+    contents = [call_args[0][0].split("] ", 1)[1] for call_args in mock_interface.sendText.call_args_list]
+    assert "".join(contents) == unicode_message
+    assert all(len(call_args[0][0].encode('utf-8')) <= mesh.MAX_TEXT_SIZE for call_args in mock_interface.sendText.call_args_list)
 
 @pytest.mark.asyncio
-@patch('meshtastic.tcp_interface.TCPInterface')
-async def test_send_waypoint(mock_tcp: Mock, mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
+async def test_send_waypoint(mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
     """Test the send_waypoint tool"""
-    mock_tcp.return_value = mock_interface
-    
-    # Set up a fixed timestamp
-    timestamp = 1717200000  # Example timestamp
+    # Call the tool
+    result = await mcp_with_tools.tools["send_waypoint"](
+        lat=37.7749,
+        lon=-122.4194,
+        name="Test Point",
+        expire="2024-06-01T00:00:00",
+        description="A test waypoint",
+        id=42
+    )
     
-    # Use the correct module path for patching
-    with patch('MCPtastic.mesh.datetime') as mock_dt_module:
-        # Set up the mock datetime module
-        mock_datetime = MagicMock()
-        mock_datetime.timestamp.return_value = timestamp
-        mock_dt_module.datetime.fromisoformat.return_value = mock_datetime
-        
-        # Call the tool
-        result = await mcp_with_tools.tools["send_waypoint"](
-            lat=37.7749,
-            lon=-122.4194,
-            name="Test Point",
-            description="A test waypoint",
-            id=42
-        )
-    
-    # Verify the interface was created and closed properly
-    mock_tcp.assert_called_once_with("meshtastic.local")
+    # Verify the naive expiry was read as UTC
     mock_interface.sendWaypoint.assert_called_once_with(
         waypoint_id=42,
         name="Test Point",
         description="A test waypoint",
-        expire=timestamp,
+        expire=1717200000,
         latitude=37.7749,
         longitude=-122.4194
     )
-    mock_interface.close.assert_called_once()
     
     # Updated assertion to match the new JSON format
-    expected_json = json.dumps({
+    assert json.loads(result) == {
         "status": "success", 
-        "message": "42 updated at lat: 37.7749 lon: -122.4194"
-    }, indent=4)
-    assert result == expected_json
+        "message": "Waypoint 42 created at lat: 37.7749, lon: -122.4194"
+    }
+    
+    # Epoch seconds are passed through as they are
+    await mcp_with_tools.tools["send_waypoint"](lat=1.0, lon=2.0, expire=1717200123, id=7)
+    assert mock_interface.sendWaypoint.call_args.kwargs["expire"] == 1717200123
 
 @pytest.mark.asyncio
-@patch('meshtastic.tcp_interface.TCPInterface')
-async def test_show_nodes(mock_tcp: Mock, mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
+async def test_show_nodes(mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
     """Test the show_nodes tool"""
-    mock_tcp.return_value = mock_interface
-    
     # Call the tool
     result = await mcp_with_tools.tools["show_nodes"]()
     
-    # Verify the interface was created and closed properly
-    mock_tcp.assert_called_once_with("meshtastic.local")
+    # Verify the shared interface was used
     mock_interface.showNodes.assert_called_once_with(True, None)
-    mock_interface.close.assert_called_once()
+    mock_interface.close.assert_not_called()
     
     # Verify the result
     assert result == "node1: Test Node\nnode2: Other Node"
 
 @pytest.mark.asyncio
-@patch('meshtastic.tcp_interface.TCPInterface')
-async def test_interface_exception(mock_tcp: Mock, mcp_with_tools: MockMCP) -> None:
-    """Test that the interface is properly closed even if an exception occurs"""
-    # Create a mock interface that raises an exception when getLongName is called
-    mock_interface = Mock()
+async def test_interface_exception(mcp_with_tools: MockMCP, mock_interface: MagicMock) -> None:
+    """Test that a failing radio call is reported and leaves the shared interface open"""
+    # Make getLongName raise an exception
     mock_interface.getLongName.side_effect = Exception("Test exception")
-    mock_tcp.return_value = mock_interface
     
-    # Call the tool and expect an exception
-    with pytest.raises(Exception, match="Test exception"):
-        await mcp_with_tools.tools["get_long_name"]()
+    # The tool reports the error instead of raising
+    assert await mcp_with_tools.tools["get_long_name"]() == "Error: Test exception"
     
-    # Verify the interface was still closed
-    mock_interface.close.assert_called_once()
\ No newline at end of file
+    # Verify the interface was not torn down
+    mock_interface.close.assert_not_called()
@@ -34,7 +34,7 @@ class TestNode(unittest.TestCase):
     async def test_show_channels_local_success(self, mock_get_node):
         # Arrange
         self.mock_local_node.channels = [MagicMock()]
-        mock_get_node.return_value = self.mock_local_node
+        mock_get_node.return_value = (self.mock_interface, self.mock_local_node)
         
         # Act - Call the function through the decorator
         # Find the proper function in the mcp.tool() decorator calls
@@ -54,10 +54,34 @@ class TestNode(unittest.TestCase):
         self.assertEqual(result_json["nodeId"], "local")
         self.assertIn("channels", result_json)
 
+    @patch('MCPtastic.node._get_node_object')
+    def test_show_channels_embeds_channel_dicts(self, mock_get_node):
+        # Arrange
+        from meshtastic.protobuf.channel_pb2 import Channel
+        channel = Channel(index=0, role=Channel.Role.PRIMARY)
+        channel.settings.name = "LongFast"
+        self.mock_local_node.channels = [channel]
+        mock_get_node.return_value = (self.mock_interface, self.mock_local_node)
+
+        show_channels_func = None
+        for call in self.mock_mcp.tool.mock_calls:
+            func = call[1][0] if call[1] else None
+            if func and func.__name__ == 'show_channels':
+                show_channels_func = func
+                break
+
+        # Act
+        result_json = json.loads(asyncio.run(show_channels_func("local")))
+
+        # Assert - channels are nested objects, not JSON strings inside JSON
+        self.assertEqual(result_json["status"], "success")
+        self.assertEqual(result_json["channels"][0]["role"], "PRIMARY")
+        self.assertEqual(result_json["channels"][0]["settings"]["name"], "LongFast")
+
     @patch('MCPtastic.node._get_node_object')
     async def test_show_channels_node_not_found(self, mock_get_node):
         # Arrange
-        mock_get_node.return_value = None
+        mock_get_node.return_value = (self.mock_interface, None)
         
         # Find the show_channels function
         show_channels_func = None
@@ -78,7 +102,7 @@ class TestNode(unittest.TestCase):
     @patch('MCPtastic.node._get_node_object')
     async def test_show_info_local_success(self, mock_get_node):
         # Arrange
-        mock_get_node.return_value = self.mock_local_node
+        mock_get_node.return_value = (self.mock_interface, self.mock_local_node)
         self.mock_interface.myInfo = {"name": "TestNode"}
         self.mock_local_node.localConfig = MagicMock()
         self.mock_local_node.moduleConfig = MagicMock()
@@ -100,11 +124,51 @@ class TestNode(unittest.TestCase):
         self.assertEqual(result_json["nodeId"], "local")
         self.assertIn("info", result_json)
 
+    def test_show_info_local_converts_protobufs(self):
+        # Arrange - the real message types a connected interface holds
+        from meshtastic.protobuf.localonly_pb2 import LocalConfig, LocalModuleConfig
+        from meshtastic.protobuf.mesh_pb2 import MyNodeInfo
+        self.mock_interface.myInfo = MyNodeInfo(my_node_num=1234, reboot_count=5)
+        self.mock_local_node.localConfig = LocalConfig()
+        self.mock_local_node.moduleConfig = LocalModuleConfig()
+        self.mock_local_node.channels = []
+        show_info_func = None
+        for call in self.mock_mcp.tool.mock_calls:
+            func = call[1][0] if call[1] else None
+            if func and func.__name__ == 'show_info':
+                show_info_func = func
+                break
+
+        # Act
+        result_json = json.loads(asyncio.run(show_info_func("local")))
+
+        # Assert
+        self.assertEqual(result_json["status"], "success")
+        self.assertEqual(result_json["info"]["myNodeInfo"], {"myNodeNum": 1234, "rebootCount": 5})
+
+    def test_show_info_many_reports_each_node(self):
+        # Arrange - one remote node with basic properties, one unknown node
+        self.mock_interface.nodes = {'!abc123': MagicMock(spec=['longName'], longName="Remote")}
+        show_info_many_func = None
+        for call in self.mock_mcp.tool.mock_calls:
+            func = call[1][0] if call[1] else None
+            if func and func.__name__ == 'show_info_many':
+                show_info_many_func = func
+                break
+
+        # Act
+        result_json = json.loads(asyncio.run(show_info_many_func(["!abc123", "!nonexistent"])))
+
+        # Assert
+        self.assertEqual(result_json["status"], "success")
+        self.assertEqual(result_json["nodes"]["!abc123"]["info"], {"longName": "Remote"})
+        self.assertEqual(result_json["nodes"]["!nonexistent"]["status"], "error")
+
     @patch('MCPtastic.node._get_node_object')
     @patch('asyncio.to_thread')
     async def test_set_owner_success(self, mock_to_thread, mock_get_node):
         # Arrange
-        mock_get_node.return_value = self.mock_local_node
+        mock_get_node.return_value = (self.mock_interface, self.mock_local_node)
         self.mock_interface.setOwner = MagicMock()
         mock_to_thread.return_value = None
         
@@ -129,7 +193,7 @@ class TestNode(unittest.TestCase):
     @patch('asyncio.to_thread')
     async def test_get_url_success(self, mock_to_thread, mock_get_node):
         # Arrange
-        mock_get_node.return_value = self.mock_local_node
+        mock_get_node.return_value = (self.mock_interface, self.mock_local_node)
         self.mock_interface.getQRCodeURL = MagicMock(return_value="https://meshtastic.org/qr#...")
         mock_to_thread.return_value = "https://meshtastic.org/qr#..."
         
@@ -150,6 +214,28 @@ class TestNode(unittest.TestCase):
         self.assertEqual(result_json["nodeId"], "local")
         self.assertIn("url", result_json)
 
+    def test_get_url_remote_names_channel_roles(self):
+        # Arrange - remote node entries carrying a numeric role
+        with_role = MagicMock(role=2)
+        with_role.name = "Ops"
+        without_role = MagicMock(spec=['name'])
+        without_role.name = "NoRole"
+        self.mock_remote_node.settings.channel_settings = [with_role, without_role]
+        get_url_func = None
+        for call in self.mock_mcp.tool.mock_calls:
+            func = call[1][0] if call[1] else None
+            if func and func.__name__ == 'get_url':
+                get_url_func = func
+                break
+
+        # Act
+        result_json = json.loads(asyncio.run(get_url_func("!abc123")))
+
+        # Assert
+        self.assertEqual(result_json["status"], "success")
+        self.assertEqual(result_json["channels"][0]["role"], "SECONDARY")
+        self.assertEqual(result_json["channels"][1]["role"], "PRIMARY")
+
     @patch('MCPtastic.node._get_node_object')
     @patch('asyncio.to_thread')
     async def test_set_url_success(self, mock_to_thread, mock_get_node):
@@ -178,7 +264,7 @@ class TestNode(unittest.TestCase):
     @patch('asyncio.to_thread')
     async def test_reboot_success(self, mock_to_thread, mock_get_node):
         # Arrange
-        mock_get_node.return_value = self.mock_local_node
+        mock_get_node.return_value = (self.mock_interface, self.mock_local_node)
         self.mock_local_node.reboot = MagicMock()
         mock_to_thread.return_value = None
         
@@ -203,7 +289,7 @@ class TestNode(unittest.TestCase):
     @patch('asyncio.to_thread')
     async def test_shutdown_success(self, mock_to_thread, mock_get_node):
         # Arrange
-        mock_get_node.return_value = self.mock_local_node
+        mock_get_node.return_value = (self.mock_interface, self.mock_local_node)
         self.mock_local_node.shutdown = MagicMock()
         mock_to_thread.return_value = None
         
@@ -228,7 +314,7 @@ class TestNode(unittest.TestCase):
     @patch('asyncio.to_thread')
     async def test_factory_reset_success(self, mock_to_thread, mock_get_node):
         # Arrange
-        mock_get_node.return_value = self.mock_local_node
+        mock_get_node.return_value = (self.mock_interface, self.mock_local_node)
         self.mock_local_node.factoryReset = MagicMock()
         mock_to_thread.return_value = None
         
@@ -252,7 +338,7 @@ class TestNode(unittest.TestCase):
     @patch('MCPtastic.node._get_node_object')
     async def test_factory_reset_node_not_found(self, mock_get_node):
         # Arrange
-        mock_get_node.return_value = None
+        mock_get_node.return_value = (self.mock_interface, None)
         
         # Find the factory_reset function
         factory_reset_func = None
@@ -277,12 +363,11 @@ class TestNode(unittest.TestCase):
         node_without_factory_reset = MagicMock()
         # Remove the factoryReset attribute
         del node_without_factory_reset.factoryReset
-        mock_get_node.return_value = node_without_factory_reset
         
         # Set up interface that doesn't have getNode method
         mock_interface = MagicMock()
         del mock_interface.getNode
-        self.mock_iface_manager.get_interface.return_value = mock_interface
+        mock_get_node.return_value = (mock_interface, node_without_factory_reset)
         
         # Find the factory_reset function
         factory_reset_func = None
@@ -301,6 +386,49 @@ class TestNode(unittest.TestCase):
         self.assertIn("does not have", result_json["message"])
         self.assertIn("factoryReset", result_json["message"])
 
+    def test_get_node_object_reuses_recent_lookup(self):
+        # Arrange - a remote node only reachable through getNode
+        self.mock_interface.nodes = None
+        self.mock_interface.nodesByNum = None
+        self.mock_interface.getNode.return_value = self.mock_remote_node
+
+        # Act
+        _, first = asyncio.run(_get_node_object(self.mock_iface_manager, "!cafe01"))
+        iface, second = asyncio.run(_get_node_object(self.mock_iface_manager, "!cafe01"))
+
+        # Assert
+        self.assertIs(first, self.mock_remote_node)
+        self.assertIs(second, self.mock_remote_node)
+        self.assertIs(iface, self.mock_interface)
+        self.mock_interface.getNode.assert_called_once_with("!cafe01")
+
+        # A new interface (e.g. after a reconnect) never sees the old entry
+        other_interface = MagicMock(nodes=None, nodesByNum=None)
+        self.mock_iface_manager.get_interface.return_value = other_interface
+        asyncio.run(_get_node_object(self.mock_iface_manager, "!cafe01"))
+        other_interface.getNode.assert_called_once_with("!cafe01")
+
+    def test_reboot_forgets_cached_node(self):
+        # Arrange
+        self.mock_interface.nodes = None
+        self.mock_interface.nodesByNum = None
+        self.mock_interface.getNode.return_value = self.mock_remote_node
+        reboot_func = None
+        for call in self.mock_mcp.tool.mock_calls:
+            func = call[1][0] if call[1] else None
+            if func and func.__name__ == 'reboot':
+                reboot_func = func
+                break
+
+        # Act
+        result_json = json.loads(asyncio.run(reboot_func(5, "!cafe02")))
+        asyncio.run(_get_node_object(self.mock_iface_manager, "!cafe02"))
+
+        # Assert - the lookup after the reboot went back to the interface
+        self.assertEqual(result_json["status"], "success")
+        self.mock_remote_node.reboot.assert_called_once_with(5)
+        self.assertEqual(self.mock_interface.getNode.call_count, 2)
+
 # This allows the tests to be run from the command line
 if __name__ == "__main__":
     unittest.main()
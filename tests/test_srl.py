@@ -111,7 +111,7 @@ class TestSerial(unittest.TestCase):
         
         # Verify interface_manager.set_interface was called with correct arguments
         mock_interface_manager.set_interface.assert_called_once_with(
-            path, "serial", None, False, True, 4403, False
+            path, "serial", None, False, True, 4403, False, timeout=30
         )
         
         # Verify connect was called on the specific interface instance
@@ -179,7 +179,7 @@ class TestSerial(unittest.TestCase):
         
         # Verify interface_manager.set_interface was called with correct arguments
         mock_interface_manager.set_interface.assert_called_once_with(
-            path, "serial", debug_out, no_proto, connect_now, 4403, no_nodes
+            path, "serial", debug_out, no_proto, connect_now, 4403, no_nodes, timeout=30
         )
         
         # Verify connect was called on the traced interface
@@ -111,7 +111,7 @@ class TestTCP(unittest.TestCase):
         
         # Verify interface_manager.set_interface was called with correct arguments
         mock_interface_manager.set_interface.assert_called_once_with(
-            address, "tcp", None, False, True, 4403, False
+            address, "tcp", None, False, True, 4403, False, timeout=30
         )
         
         # Verify connect was called on the specific interface instance
@@ -180,7 +180,7 @@ class TestTCP(unittest.TestCase):
         
         # Verify interface_manager.set_interface was called with correct arguments
         mock_interface_manager.set_interface.assert_called_once_with(
-            address, "tcp", debug_out, no_proto, connect_now, port_number, no_nodes
+            address, "tcp", debug_out, no_proto, connect_now, port_number, no_nodes, timeout=30
         )
         
         # Verify connect was called on the traced interface
@@ -1,10 +1,13 @@
 import pytest
+import asyncio
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, AsyncMock, MagicMock  # Add AsyncMock import
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from MCPtastic.utils import utf8len, get_location_from_ip
+from MCPtastic.utils import utf8len, json_dumps, json_loads, get_location_from_ip, use_mesh_executor
 
 
 def test_utf8len_ascii():
@@ -22,6 +25,52 @@ def test_utf8len_unicode():
     assert utf8len("Café") == 5  # Latin character with accent
 
 
+def test_json_dumps_round_trip():
+    """Test json_dumps output parses back to the same object."""
+    data = {"name": "Café 😀", "values": [1, 2.5, None, True], "nested": {"a": "b"}}
+    assert json.loads(json_dumps(data)) == data
+    assert json.loads(json_dumps(data, indent=True)) == data
+    assert "\n" in json_dumps(data, indent=True)
+
+
+def test_json_loads_invalid_raises_json_error():
+    """Test json_loads raises the stdlib error type with or without orjson."""
+    assert json_loads('{"a": [1, 2]}') == {"a": [1, 2]}
+    assert json_loads(b'{"a": 1}') == {"a": 1}
+    with pytest.raises(json.JSONDecodeError):
+        json_loads("{ invalid json }")
+    with patch('MCPtastic.utils.orjson', None):
+        with pytest.raises(json.JSONDecodeError):
+            json_loads("{ invalid json }")
+
+
+def test_use_mesh_executor_runs_to_thread_on_shared_pool():
+    """Test that the lifespan routes asyncio.to_thread onto the mesh executor"""
+    async def thread_name():
+        async with use_mesh_executor(None):
+            return await asyncio.to_thread(lambda: threading.current_thread().name)
+    
+    # asyncio.run shuts the default executor down, so hand it a throwaway one
+    with patch('MCPtastic.utils.mesh_executor', ThreadPoolExecutor(max_workers=1, thread_name_prefix="test-mesh")):
+        assert asyncio.run(thread_name()).startswith("test-mesh")
+
+
+def test_json_dumps_without_orjson():
+    """Test json_dumps falls back to the stdlib encoder."""
+    with patch('MCPtastic.utils.orjson', None):
+        assert json_dumps({"a": 1}) == '{"a": 1}'
+        assert json_dumps({"a": 1}, indent=True) == '{\n    "a": 1\n}'
+
+
+def test_json_dumps_pretty_env_default():
+    """Test json_dumps is compact by default and pretty when MCPTASTIC_PRETTY is set."""
+    with patch('MCPtastic.utils.orjson', None):
+        assert json_dumps({"a": 1}) == '{"a": 1}'
+        with patch('MCPtastic.utils.PRETTY_JSON', True):
+            assert json_dumps({"a": 1}) == '{\n    "a": 1\n}'
+            assert json_dumps({"a": 1}, indent=False) == '{"a": 1}'
+
+
 @pytest.mark.asyncio
 @patch('httpx.AsyncClient')
 async def test_get_location_from_ip_success(mock_client):